@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_processing import process_lai_data
+
+
+DEFAULT_PROCESS_CACHE_SIZE = 4
+
+
+@dataclass
+class LaiResult:
+    """
+    Results of processing the LAI data files.
+
+    Attributes:
+        data_frame (pd.DataFrame): DataFrame with the LAI statistics of every
+          land use and elevation cluster (see `create_lai_data_frame`).
+        lai_file_paths (List[Path]): Paths to the converted LAI rasters.
+        unified_lai_arrays (numpy.ndarray): Stack of the LAI rasters resampled
+          to the template grid.
+        unified_dem (numpy.ndarray): DEM resampled to the template grid
+          (elevations, not elevation classes).
+
+    Notes:
+        - All attributes except `data_frame` are None unless the data were
+          loaded with `require_temp_files=True`.
+    """
+    data_frame: pd.DataFrame
+    lai_file_paths: List[Path] | None = None
+    unified_lai_arrays: np.ndarray | None = None
+    unified_dem: np.ndarray | None = None
+
+    @property
+    def list_of_data_for_modifying(self) -> list:
+        """
+        The data needed by `modification_lai_datas`, in the order returned
+        by `process_lai_data`.
+        """
+        return [self.lai_file_paths, self.unified_lai_arrays, self.unified_dem]
+
+
+def _get_modification_time(path: str | None) -> float | None:
+    """
+    Get the modification time of a file or folder.
+
+    Parameters:
+        path (str or None): Path to the file or folder.
+
+    Returns:
+        float or None: The modification time of the path, or None if no path
+          is given or the path does not exist.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+    return os.path.getmtime(path)
+
+
+def _get_folder_signature(path: str) -> Tuple[tuple, ...] | None:
+    """
+    Get the name, modification time and size of every file in a folder.
+
+    The modification time of a folder only changes when entries are added,
+    removed or renamed, not when a file inside it is overwritten. Keying the
+    cache on the files themselves also detects updated LAI files.
+
+    Parameters:
+        path (str): Path to the folder.
+
+    Returns:
+        tuple or None: Sorted tuple of (name, modification time, size) of the
+          files in the folder, or None if the folder does not exist.
+    """
+    if not os.path.isdir(path):
+        return None
+
+    signature = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                file_stat = entry.stat()
+                signature.append(
+                    (entry.name, file_stat.st_mtime, file_stat.st_size)
+                )
+
+    return tuple(sorted(signature))
+
+
+@lru_cache(maxsize=DEFAULT_PROCESS_CACHE_SIZE)
+def _cached_process_lai_data(
+    cache_key: tuple,
+    lai_folder_path: str,
+    land_use_path: str,
+    dem_file_path: str,
+    elevation_bins: Tuple[int, ...],
+    land_use_classes_of_interest: Tuple[int, ...] | None,
+    aoi_boundary_file: str | None,
+    year: int | None,
+) -> pd.DataFrame:
+    """
+    Call `process_lai_data` and memoize the resulting DataFrame.
+
+    The `cache_key` describes the current state of the input files, so
+    the cached result is dropped as soon as one of the inputs changes. All
+    other arguments must be hashable.
+    """
+    data_frame, _ = process_lai_data(
+        lai_folder_path,
+        land_use_path,
+        dem_file_path,
+        None if elevation_bins is None else list(elevation_bins),
+        (
+            None
+            if land_use_classes_of_interest is None
+            else list(land_use_classes_of_interest)
+        ),
+        aoi_boundary_file,
+        return_modifying=False,
+        year=year,
+    )
+    return data_frame
+
+
+def load_lai_data(
+    lai_folder_path: str,
+    land_use_path: str,
+    dem_file_path: str,
+    elevation_bins: List[int],
+    land_use_classes_of_interest: List[int] | None = None,
+    aoi_boundary_file: str | None = None,
+    require_temp_files: bool = False,
+    year: int | None = None,
+) -> LaiResult:
+    """
+    Process LAI data files, reusing the result of a previous call with the
+    same inputs.
+
+    Running the raster pipeline is by far the most expensive part of every
+    `run_*` function. Chaining several of them (e.g. CSV export followed by
+    plotting) would otherwise read and resample all rasters again.
+
+    Parameters:
+        lai_folder_path (str): Path to the folder containing LAI data files.
+        land_use_path (str): Path to the land use raster file.
+        dem_file_path (str): Path to the digital elevation model (DEM) file.
+        elevation_bins (List[int]): Elevation bins for classification.
+        land_use_classes_of_interest (Optional[List[int]]): List of land use
+         classes to include in the analysis. If None, all classes are included.
+        aoi_boundary_file (Optional[str]): Path to a boundary file defining the
+          area of interest. If None, the entire area is analyzed.
+        require_temp_files (bool): Whether the caller needs the temporary
+          rasters and resampled arrays referenced by the result (e.g. for LAI
+          modification). These data are never cached: the caller modifies
+          and removes the rasters, so the data are always processed again.
+          Defaults to False, which means only the DataFrame is returned and
+          cached, so the large resampled LAI stack is released right after
+          processing.
+        year (int, optional): Process only the LAI files of this year.
+          Defaults to None, which means all files are processed.
+
+    Returns:
+        LaiResult: The results of `process_lai_data`. The DataFrame is a
+          copy, so callers may modify it without affecting the cache.
+
+    Notes:
+        - The cache is keyed by the name, modification time and size of every
+          file in the LAI folder, by the modification times of the land use,
+          DEM and AOI files and by all processing parameters, including
+          `year`.
+    """
+    # The temporary rasters are modified and removed by the caller, so they
+    # are never taken from the cache
+    if require_temp_files:
+        data_frame, list_of_data_for_modifying = process_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+            return_modifying=True,
+            year=year,
+        )
+        return LaiResult(data_frame, *list_of_data_for_modifying)
+
+    cache_key = (_get_folder_signature(lai_folder_path),) + tuple(
+        _get_modification_time(path)
+        for path in (
+            land_use_path,
+            dem_file_path,
+            aoi_boundary_file,
+        )
+    )
+    cache_args = (
+        cache_key,
+        str(lai_folder_path),
+        str(land_use_path),
+        str(dem_file_path),
+        None if elevation_bins is None else tuple(elevation_bins),
+        (
+            None
+            if land_use_classes_of_interest is None
+            else tuple(land_use_classes_of_interest)
+        ),
+        None if aoi_boundary_file is None else str(aoi_boundary_file),
+        year,
+    )
+    data_frame = _cached_process_lai_data(*cache_args)
+
+    return LaiResult(data_frame.copy())
@@ -12,6 +12,17 @@ DEFAULT_CSV_FOLDER = "results\\results_daily_csv"
 DEFAULT_CSV_PREFIX_FILENAME = "daily_lai.csv"
 DEFAULT_CSV_YEAR_FILENAME = "mean_characteristic_year.csv"
 DEFAULT_CSV_FILENAME = "lai.csv"
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+LAI_STAT_COLUMNS = [
+    "Mean_LAI",
+    "Min",
+    "Q1",
+    "Median",
+    "Q3",
+    "Max",
+    "Lower Whisker",
+    "Upper Whisker",
+]
 
 
 def save_data_to_csv(
@@ -26,6 +37,8 @@ def save_data_to_csv(
     specify the name of the file and the folder where the CSV will be stored.
     If no custom filename or folder is provided, the function will use the
     default settings. The DataFrame is saved without the index column.
+    If the filename ends with ".parquet", the DataFrame is saved as a Parquet
+    file instead.
 
     Parameters:
         dataframe (pd.DataFrame): The DataFrame containing LAI data to be saved
@@ -42,6 +55,10 @@ def save_data_to_csv(
         - The function ensures that the specified results folder exists before
           attempting to save the file
         - The DataFrame is saved without the index column to keep the CSV clean
+        - Parquet files keep the column types (e.g. categories and dates),
+          are compressed with `DEFAULT_PARQUET_COMPRESSION` and are much
+          faster to write and read back than CSV files. Writing them needs
+          pyarrow (or fastparquet).
     """
     # Ensure the results folder exists
     directory_path = ensure_directory_exists(results_folder)
@@ -49,8 +66,16 @@ def save_data_to_csv(
     # Formulate the full path to the output CSV file
     filepath = os.path.join(directory_path, filename)
 
+    # Save the DataFrame to a Parquet file if requested by the extension
+    if Path(filename).suffix.lower() == ".parquet":
+        dataframe.to_parquet(
+            filepath,
+            index=False,
+            compression=DEFAULT_PARQUET_COMPRESSION,
+        )
     # Save the DataFrame to a CSV file
-    dataframe.to_csv(filepath, index=False)
+    else:
+        dataframe.to_csv(filepath, index=False)
 
 
 def create_stat_lai_by_clusters(
@@ -86,22 +111,29 @@ def create_stat_lai_by_clusters(
           and "Elevation_class".
         - Columns "Year", "Landuse", and "Elevation_class" are removed from
           each group before saving to CSV.
+        - The input DataFrame is not modified.
     """
-    dataframe["Date"] = pd.to_datetime(dataframe["Date"])
-    dataframe["Year"] = dataframe["Date"].dt.year
+    dates = pd.to_datetime(dataframe["Date"])
+    years = dates.dt.year.rename("Year")
+
+    # Remove the grouping columns once for the whole DataFrame instead of
+    # for every group
+    values = dataframe.drop(
+        columns=["Year", "Landuse", "Elevation_class"], errors="ignore"
+    ).assign(Date=dates)
 
     # Group by the unique combinations of Years, Landuse, and Elevation_class
-    grouped = dataframe.groupby(["Year", "Landuse", "Elevation_class"])
+    grouped = dataframe.groupby(
+        [years, "Landuse", "Elevation_class"], observed=True
+    )
 
     # Iterate through each group and save to a CSV
-    for (year, landuse, elevation_class), group in grouped:
+    for (year, landuse, elevation_class), rows in grouped.indices.items():
 
         # Formulate the full path to the output CSV file
         filename = f"lai_data_{year}_{landuse}_{elevation_class}.csv"
 
-        group = group.drop(["Year", "Landuse", "Elevation_class"], axis=1)
-
-        save_data_to_csv(group, filename, results_folder)
+        save_data_to_csv(values.iloc[rows], filename, results_folder)
 
 
 def create_stat_lai_by_day_of_year(
@@ -124,32 +156,37 @@ def create_stat_lai_by_day_of_year(
         None
 
     Notes:
-        - The 'Day_of_Year' column is added to the DataFrame in the format
-          'MM-DD' to represent each day of the year.
+        - The data is grouped by an integer day key (MMDD), which is much
+          faster to group on than strings. The 'Day_of_Year' column of the
+          result is formatted as 'MM-DD' just before saving.
+        - The input DataFrame is not modified.
     """
     # Convert the 'Date' column to datetime format if not already
-    data_frame["Date"] = pd.to_datetime(data_frame["Date"])
-
-    # Extract the day of the year in 'MM-DD' format
-    data_frame["Day_of_Year"] = data_frame["Date"].dt.strftime("%m-%d")
+    dates = pd.to_datetime(data_frame["Date"])
+
+    # Encode the day of the year as an integer in MMDD form
+    day_of_year = pd.Series(
+        dates.dt.month.to_numpy(dtype=np.int16) * 100
+        + dates.dt.day.to_numpy(dtype=np.int16),
+        index=data_frame.index,
+        name="Day_of_Year",
+    )
 
     # Group by 'Day_of_Year', 'Landuse', and 'Elevation_class' and calculate
-    # the mean LAI
-    mean_lai_by_day = (
-        data_frame.groupby(["Day_of_Year", "Landuse", "Elevation_class"])
-        .agg(
-            {
-                "Mean_LAI": "mean",
-                "Min": "mean",
-                "Q1": "mean",
-                "Median": "mean",
-                "Q3": "mean",
-                "Max": "mean",
-                "Lower Whisker": "mean",
-                "Upper Whisker": "mean",
-            }
-        )
-        .reset_index()
+    # the mean of all statistical columns in a single pass. The keys are
+    # returned as columns directly, without building a MultiIndex first
+    mean_lai_by_day = data_frame.groupby(
+        [day_of_year, "Landuse", "Elevation_class"],
+        as_index=False,
+        observed=True,
+    )[LAI_STAT_COLUMNS].mean()
+
+    # Format the day of the year back to 'MM-DD'
+    day_key = mean_lai_by_day["Day_of_Year"]
+    mean_lai_by_day["Day_of_Year"] = (
+        (day_key // 100).astype(str).str.zfill(2)
+        + "-"
+        + (day_key % 100).astype(str).str.zfill(2)
     )
 
     save_data_to_csv(mean_lai_by_day, file_name, results_folder)
@@ -1,8 +1,12 @@
-from collections import namedtuple
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+import os
 from pathlib import Path
 import pickle
-from typing import List, Tuple, Union
+import tempfile
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -13,14 +17,19 @@ from decorators import measure_time
 from file_management import grab_raw_lai_data_files, ensure_directory_exists
 from raster_processing import (
     read_raster,
+    read_raster_cached,
     create_template_raster,
-    convert_hdr_to_tif,
+    convert_hdr_files_to_tif,
     save_lai_to_raster,
     cut_land_use_file_path,
+    DEFAULT_RASTER_CACHE_SIZE,
     DEFAULT_TEMP_DIR,
     DEFAULT_TEMP_RASTER_NAME
 )
-from statistics_processing import calculate_mean_and_boxplot_lai
+from statistics_processing import (
+    build_cluster_index,
+    calculate_cluster_stats,
+)
 
 # Define a named tuple for the results of the
 # process_lai_files_and_extract_data function
@@ -41,10 +50,17 @@ LAIRecord = namedtuple(
     ],
 )
 
-DEFAULT_TEMP_LAI_DIR ="temp\\temp_lai_unifited"
-DEFAULT_TEMP_LANDUSE_NAME = "unifited_landuse"
 DEFAULT_MODIFY_LAI_FOLDER = "results\\modify_lai"
 DEFAULT_UNMODIFY_FOLDER = "results\\unmodify_data"
+DEFAULT_GDAL_CACHEMAX = 2048  # MB
+DEFAULT_GDAL_NUM_THREADS = "ALL_CPUS"
+DEFAULT_WARP_MEM_LIMIT = 256  # MB
+DEFAULT_MEMMAP_THRESHOLD = 4 * 1024**3  # bytes
+DEFAULT_STATS_BATCH_SIZE = 512 * 1024**2  # bytes
+# Threads writing the modified LAI rasters and the number of rasters that
+# may wait for them
+DEFAULT_RASTER_WRITERS = 2
+DEFAULT_MAX_PENDING_WRITES = 4
 
 
 def copy_data_to_template(
@@ -139,8 +155,171 @@ def copy_data_to_template(
     return unifited_file
 
 
+def copy_data_to_template_in_memory(
+    template_raster: Path,
+    source_file: Path,
+) -> np.ndarray:
+    """
+    Resamples the first band of source_file to match the extent and
+    resolution of template_raster and returns it as an array.
+
+    This is the in-memory counterpart of `copy_data_to_template`: the
+    resampled data is not written to disk and read back, but returned
+    directly.
+
+    Parameters:
+        template_raster (Path): Path to the template raster file used for the
+          extent and resolution.
+        source_file (Path): Path to the input raster file containing data to be
+          resampled.
+
+    Returns:
+        numpy.ndarray: A float32 2D array with the resampled data. Pixels that
+          are not covered by valid source data are set to 0.
+    """
+    return resample_rasters_to_template(template_raster, [source_file])[0]
+
+
+@lru_cache(maxsize=DEFAULT_RASTER_CACHE_SIZE)
+def _cached_copy_data_to_template(
+    template_raster: str,
+    template_grid: tuple,
+    source_file: str,
+    modification_time: float,
+) -> np.ndarray:
+    """
+    Call `copy_data_to_template_in_memory` and memoize its result as a
+    read-only array.
+
+    The `template_grid` and `modification_time` are part of the cache key,
+    so the data are resampled again for another grid or a changed file.
+    """
+    data = copy_data_to_template_in_memory(
+        Path(template_raster), Path(source_file)
+    )
+    data.flags.writeable = False
+    return data
+
+
+def copy_data_to_template_cached(
+    template_raster: Path,
+    source_file: Path,
+) -> np.ndarray:
+    """
+    Resamples the first band of source_file to match the extent and
+    resolution of template_raster, reusing the result of a previous call for
+    the same grid and unchanged source file.
+
+    Static inputs such as the DEM are resampled to the same template grid in
+    every run of a Python session, so they only need to be warped once.
+
+    Parameters:
+        template_raster (Path): Path to the template raster file used for the
+          extent and resolution.
+        source_file (Path): Path to the input raster file containing data to be
+          resampled.
+
+    Returns:
+        numpy.ndarray: A read-only float32 2D array with the resampled data.
+          Pixels that are not covered by valid source data are set to 0.
+
+    Notes:
+        - The cache is keyed by the CRS, transform and shape of the template,
+          the resolved source path and its modification time, and keeps at
+          most `DEFAULT_RASTER_CACHE_SIZE` arrays.
+    """
+    with rasterio.open(template_raster) as template:
+        template_grid = (
+            template.crs.to_wkt() if template.crs else None,
+            tuple(template.transform),
+            template.shape,
+        )
+
+    source_file = Path(source_file).resolve()
+    return _cached_copy_data_to_template(
+        str(template_raster),
+        template_grid,
+        str(source_file),
+        os.path.getmtime(source_file),
+    )
+
+
+def resample_rasters_to_template(
+    template_raster: Path,
+    source_files: List[Path],
+    memmap_threshold: int = DEFAULT_MEMMAP_THRESHOLD,
+) -> np.ndarray:
+    """
+    Resamples the first band of several rasters to match the extent and
+    resolution of template_raster and stacks them into a single array.
+
+    The template grid is read only once and all rasters are warped directly
+    into one preallocated 3D array, using all available CPU cores. The source
+    rasters are never loaded as a whole: GDAL streams them block by block and
+    warps the output in chunks of at most `DEFAULT_WARP_MEM_LIMIT` MB.
+
+    Parameters:
+        template_raster (Path): Path to the template raster file used for the
+          extent and resolution.
+        source_files (List[Path]): Paths to the input raster files containing
+          data to be resampled.
+        memmap_threshold (int, optional): Size in bytes from which the array
+          is backed by a temporary file instead of RAM. Defaults to
+          `DEFAULT_MEMMAP_THRESHOLD`.
+
+    Returns:
+        numpy.ndarray: A float32 3D array of shape (len(source_files), height,
+          width) with the resampled data, in the order of `source_files`.
+          Pixels that are not covered by valid source data are set to 0.
+
+    Notes:
+        - Large stacks are returned as a `numpy.memmap` over an anonymous
+          temporary file, so the operating system pages the data in and out
+          as needed. The file is deleted automatically when the array is
+          released.
+    """
+    with rasterio.open(template_raster) as template:
+        dst_crs = template.crs
+        dst_transform = template.transform
+        dst_shape = template.shape
+
+    # Start from zeros, as the template raster does. Large stacks are
+    # memory-mapped to a temporary file, which is zero-filled as well
+    stack_shape = (len(source_files), *dst_shape)
+    stack_size = np.prod(stack_shape, dtype=np.int64) * 4
+    if stack_size >= memmap_threshold:
+        data_resampled = np.memmap(
+            tempfile.TemporaryFile(),
+            dtype=np.float32,
+            mode="w+",
+            shape=stack_shape,
+        )
+    else:
+        data_resampled = np.zeros(stack_shape, dtype=np.float32)
+
+    for i, source_file in enumerate(source_files):
+        with rasterio.open(source_file) as src:
+            # Resample data using nearest neighbor interpolation; nodata
+            # pixels of the source are skipped and keep the zero value
+            reproject(
+                source=rasterio.band(src, 1),
+                destination=data_resampled[i],
+                src_transform=src.transform,
+                src_crs=src.crs,
+                dst_transform=dst_transform,
+                dst_crs=dst_crs,
+                dst_nodata=0,
+                init_dest_nodata=False,
+                resampling=Resampling.nearest,
+                num_threads=os.cpu_count(),
+                warp_mem_limit=DEFAULT_WARP_MEM_LIMIT,
+            )
+
+    return data_resampled
+
+
 def classify_elevation(
-    unified_dem: Path,
+    unified_dem: Path | np.ndarray,
     elevation_bins: List[int] = None
 ) -> Tuple[np.ndarray, List[str]]:
     """
@@ -149,8 +328,9 @@ def classify_elevation(
     generated in multiples of 100.
 
     Parameters:
-        unified_dem (Path): Path to the raster file containing the elevation
-          data.
+        unified_dem (Path or numpy.ndarray): Path to the raster file
+          containing the elevation data, or the elevation data itself. If an
+          array is passed, the raster is not read again.
         elevation_bins (List[int]): List of elevation thresholds for
          classification. Elevation values will be categorized into bins defined
          by these thresholds. If None, thresholds will be generated in
@@ -164,8 +344,11 @@ def classify_elevation(
             range of each zone.
     """
 
-    # Read the elevation data from the raster file
-    unified_dem_data = read_raster(unified_dem)
+    # Read the elevation data from the raster file unless already loaded
+    if isinstance(unified_dem, np.ndarray):
+        unified_dem_data = unified_dem
+    else:
+        unified_dem_data = read_raster(unified_dem)
     
     # Determine min and max elevation values
     min_elevation = np.min(unified_dem_data)
@@ -178,9 +361,12 @@ def classify_elevation(
         elevation_bins = list(range(min_bin, max_bin, 100))
 
     # Classify elevation data into bins
-    elevation_classes = (
-        np.digitize(unified_dem_data, bins=elevation_bins, right=True) + 1
-    )
+    # Elevation classes are small bin indices, so int16 is sufficient (the
+    # classes start at 1, which is added in place to avoid another copy)
+    elevation_classes = np.digitize(
+        unified_dem_data, bins=elevation_bins, right=True
+    ).astype(np.int16)
+    elevation_classes += 1
 
     # Generate labels for each elevation zone
     elevation_labels = (
@@ -220,24 +406,30 @@ def extract_date_from_filename(filename: Path) -> datetime:
 
 
 def process_lai_files_and_extract_data(
-    unified_lai_list: List[Path],
+    lai_file_paths: List[Path],
+    unified_lai_arrays: np.ndarray,
     land_use_file_path: str,
     elevation_classes: np.ndarray,
     elevation_labels: List[str],
-) -> List[LAIRecord]:
+    land_use_classes_of_interest: List[int] | None = None,
+    stats_batch_size: int = DEFAULT_STATS_BATCH_SIZE,
+) -> Dict[str, np.ndarray]:
     """
     Process LAI (Leaf Area Index) raster files and extract mean LAI value based
     on land use and elevation classes.
 
-    This function reads LAI raster files, extracts date information from
-    filenames, and computes the mean LAI values and boxplot statistics for
-    different land use and elevation classes. The results are compiled into a
-    list of records containing the date, land use class, elevation class, mean
-    LAI value, and boxplot statistics.
+    This function takes resampled LAI rasters, extracts date information from
+    their filenames, and computes the mean LAI values and boxplot statistics
+    for different land use and elevation classes. The results are compiled
+    into columns containing the date, land use class, elevation class, mean
+    LAI value, and boxplot statistics of every record.
 
     Parameters:
-        unified_lai_list (list of Path): A list of Path objects pointing to the
-          LAI raster files that have been resampled to a uniform template.
+        lai_file_paths (list of Path): A list of Path objects pointing to the
+          LAI raster files, used to extract the date of each raster.
+        unified_lai_arrays (numpy.ndarray): The LAI rasters (in the same
+          order as `lai_file_paths`) resampled to a uniform template, stacked
+          along the first axis.
         land_use_file_path (str or Path): Path to the land use raster file used
           to classify land use types.
         elevation_classes (numpy.ndarray): A 2D array representing elevation
@@ -245,22 +437,29 @@ def process_lai_files_and_extract_data(
           location.
         elevation_labels (list of str): A list of labels describing each
           elevation class.
+        land_use_classes_of_interest (list of int, optional): Land use
+          classes for which the statistics are calculated. Defaults to None,
+          which means all classes except 0 will be processed.
+        stats_batch_size (int, optional): Maximum size in bytes of the LAI
+          values gathered at once for the statistics. Defaults to
+          `DEFAULT_STATS_BATCH_SIZE`.
 
     Returns:
-    List[LAIRecord]: A list of records, where each record is a list containing:
-                - Date (datetime): The date extracted from the LAI file name.
-                - Landuse (int): The land use class.
+    Dict[str, numpy.ndarray]: The columns of the records, one row per LAI file
+                and cluster, keyed by:
+                - Date (datetime64[s]): The date extracted from the LAI file
+                  name.
+                - Landuse: The land use class.
                 - Elevation_class (str): The label of the elevation class.
-                - average_LAI (float): The mean LAI value for the corresponding
+                - Mean_LAI (float32): The mean LAI value for the corresponding
                   land use and elevation class.
-                - Min (float): Minimum LAI value.
-                - Q1 (float): First quartile.
-                - Median (float): Median (second quartile).
-                - Q3 (float): Third quartile.
-                - Max (float): Maximum LAI value.
-                - Lower Whisker (float): Lower whisker value.
-                - Upper Whisker (float): Upper whisker value.
-                - Outliers (list): List of outlier values.
+                - Min (float32): Minimum LAI value.
+                - Q1 (float32): First quartile.
+                - Median (float32): Median (second quartile).
+                - Q3 (float32): Third quartile.
+                - Max (float32): Maximum LAI value.
+                - Lower Whisker (float32): Lower whisker value.
+                - Upper Whisker (float32): Upper whisker value.
 
     Notes:
         - The date is extracted from the LAI file name, assuming the file name
@@ -268,84 +467,114 @@ def process_lai_files_and_extract_data(
           year and DDD is the day of the year.
         - The function assumes that the land use and elevation rasters have the
           same spatial resolution and extent as the LAI rasters.
+        - The LAI values of several files are gathered into a single
+          (n_files, n_pixels) matrix, so the statistics of all clusters are
+          calculated for these files in one vectorized call. The files are
+          processed in batches of at most `stats_batch_size` bytes, so the
+          gathered values never need as much memory as the whole LAI stack,
+          which may be memory-mapped to disk.
+        - The records are returned as columns rather than one Python list per
+          row, so no Python code runs per file and cluster.
     """
     # Read the land use data from the specified raster file
-    landuse = read_raster(Path(land_use_file_path))
-    # Get unique land use classes present in the raster
-    unique_landuse_classes = np.unique(landuse)
-
-    data = []
-    for lai_file in unified_lai_list:
-        # Extract date information from the LAI file name
-        date = extract_date_from_filename(lai_file)
-
-        # Read LAI data from the current file
-        lai_data = read_raster(lai_file)
-
-        # Loop through each unique land use class
-        for landuse_class in unique_landuse_classes:
-            # Loop through each elevation class
-            for elev_class in range(1, len(elevation_labels) + 1):
-                # Calculate mean LAI and boxplot statistics for the current
-                # land use and elevation class
-                stats = calculate_mean_and_boxplot_lai(
-                    lai_data, landuse,
-                    elevation_classes,
-                    landuse_class, elev_class
-                )
-                if stats is not None:
-                    data.append(
-                        [
-                            date,
-                            landuse_class,
-                            elevation_labels[elev_class - 1],
-                            stats["Mean_LAI"],
-                            stats["Min"],
-                            stats["Q1"],
-                            stats["Median"],
-                            stats["Q3"],
-                            stats["Max"],
-                            stats["Lower Whisker"],
-                            stats["Upper Whisker"],
-                        ]
-                    )
+    landuse = read_raster_cached(Path(land_use_file_path))
+
+    # Group the pixels by land use and elevation class once; every cluster
+    # is then a contiguous slice of the reordered LAI raster
+    (
+        order,
+        cluster_landuse,
+        cluster_elevation,
+        starts,
+        ends,
+    ) = build_cluster_index(
+        landuse, elevation_classes, land_use_classes_of_interest
+    )
+
+    # Process as many LAI files at once as fit into the batch size
+    n_files = len(lai_file_paths)
+    lai_stack = unified_lai_arrays.reshape(n_files, landuse.size)
+    files_per_batch = max(1, stats_batch_size // max(1, order.size * 4))
+
+    batch_stats = []
+    for first in range(0, max(n_files, 1), files_per_batch):
+        # Gather the LAI values of the batch into a (n_files, n_pixels)
+        # matrix whose columns are ordered by cluster
+        lai_matrix = lai_stack[first:first + files_per_batch][:, order]
+
+        # Calculate the mean LAI and boxplot statistics of all land use and
+        # elevation clusters for all LAI files of the batch at once
+        batch_stats.append(calculate_cluster_stats(lai_matrix, starts, ends))
+
+    stats = {
+        stat_name: np.concatenate([batch[stat_name] for batch in batch_stats])
+        for stat_name in batch_stats[0]
+    }
+
+    # Build the columns of all records at once: the rows are ordered by LAI
+    # file and then by cluster, so the file values are repeated and the
+    # cluster values are tiled
+    n_clusters = len(cluster_landuse)
+    dates = np.array(
+        [extract_date_from_filename(lai_file) for lai_file in lai_file_paths],
+        dtype="datetime64[s]",
+    )
+    cluster_labels = np.asarray(elevation_labels, dtype=object)[
+        cluster_elevation - 1
+    ]
+
+    data = {
+        "Date": np.repeat(dates, n_clusters),
+        "Landuse": np.tile(cluster_landuse, n_files),
+        "Elevation_class": np.tile(cluster_labels, n_files),
+    }
+    # The statistics are named like the DataFrame columns
+    for stat_name, values in stats.items():
+        data[stat_name] = values.ravel()
 
     return data
 
 
-def filter_lai_data_by_landuse(
-    data: List[LAIRecord],
-    land_use_classes_of_interest: List[int] | None = None
+def create_lai_data_frame(
+    data: List[LAIRecord] | Dict[str, np.ndarray],
 ) -> pd.DataFrame:
     """
-    Creates a DataFrame from the provided LAI data and filters it based on
-    specified land use classes.
+    Creates a DataFrame from the provided LAI data.
 
     This function constructs a pandas DataFrame from the input data, which
-    should include columns for date, land use, elevation class, and average LAI
-    values. It then filters the DataFrame to include only the rows where the
-    land use class is in the list of land use classes of interest.
+    should include columns for date, land use, elevation class, mean LAI and
+    boxplot statistics. The data is expected to contain only the land use
+    classes of interest, since they are already selected during extraction.
 
     Parameters:
-        data (List[LAIRecord]): The raw data to be converted into a DataFrame.
-                             Each entry should be a list containing date, land
-                             use class, elevation class, and average LAI value.
-        land_use_classes_of_interest (Optional[List[int]]): A list of land use
-                             classes that should be included in the filtered
-                             DataFrame.
-                             Defaults to None, which means all classes except 0
-                             will be included.
+        data (List[LAIRecord] or Dict[str, numpy.ndarray]): The raw data to be
+                             converted into a DataFrame. Either a list of
+                             records containing date, land use class,
+                             elevation class, and LAI statistics, or the
+                             columns of these records keyed by column name
+                             (as returned by
+                             `process_lai_files_and_extract_data`).
 
     Returns:
-        pd.DataFrame: A filtered DataFrame containing only rows with land use
-         classes specified in land_use_classes_of_interest.
+        pd.DataFrame: A DataFrame containing the LAI data.
+
+    Raises:
+        ValueError: If a land use class does not fit into uint16 (e.g. a
+          negative nodata value of the land use raster).
 
     Notes:
         - The DataFrame columns are named as 'Date', 'Landuse',
-          'Elevation_class', and 'average_LAI'.
+          'Elevation_class', 'Mean_LAI', 'Min', 'Q1', 'Median', 'Q3', 'Max',
+          'Lower Whisker' and 'Upper Whisker'.
+        - The rows are sorted by date.
+        - 'Landuse' holds uint16 values, 'Date' is datetime64[s] and all LAI
+          statistics are float32.
+        - 'Landuse' and 'Elevation_class' are categorical columns, which makes
+          grouping by them much faster. Their categories are sorted, so the
+          groups are ordered the same way as with plain columns.
     """
     # Create a DataFrame from the provided data with specified columns
-    df_full = pd.DataFrame(
+    data_frame = pd.DataFrame(
         data,
         columns=[
             "Date",
@@ -362,18 +591,35 @@ def filter_lai_data_by_landuse(
         ],
     )
 
-    # Convert the 'Landuse' column to integer type
-    df_full["Landuse"] = df_full["Landuse"].astype(int)
+    # Make sure the land use classes fit into uint16, so that codes such as
+    # a nodata value of -9999 are not silently wrapped to other classes
+    landuse = data_frame["Landuse"]
+    uint16_max = np.iinfo(np.uint16).max
+    out_of_range = (landuse < 0) | (landuse > uint16_max)
+    if out_of_range.any():
+        raise ValueError(
+            f"Land use classes must be between 0 and {uint16_max}, got "
+            f"{sorted(landuse[out_of_range].unique().tolist())}"
+        )
 
-    # If land_use_classes_of_interest is None, filter out only land use class 0
-    if land_use_classes_of_interest is None:
-        data_frame = df_full[df_full["Landuse"] != 0].copy()
-    else:
-        # Filter the DataFrame to include only rows where 'Landuse' is in the
-        # specified list
-        data_frame = df_full[
-            df_full["Landuse"].isin(land_use_classes_of_interest)
-        ].copy()
+    # Use the narrowest dtypes that hold the data: land use classes fit into
+    # uint16, LAI statistics into float32 and dates need second precision
+    data_frame["Landuse"] = landuse.astype(np.uint16)
+    data_frame["Date"] = data_frame["Date"].astype("datetime64[s]")
+    stat_columns = data_frame.columns[3:]
+    data_frame[stat_columns] = data_frame[stat_columns].astype(np.float32)
+
+    # Sort the rows by date (stable, so the cluster order within a date is
+    # kept), which lets consumers select periods with cheap slices
+    data_frame = data_frame.sort_values(
+        "Date", kind="mergesort", ignore_index=True
+    )
+
+    # Store the cluster keys as categories
+    data_frame["Landuse"] = data_frame["Landuse"].astype("category")
+    data_frame["Elevation_class"] = data_frame["Elevation_class"].astype(
+        "category"
+    )
 
     return data_frame
 
@@ -386,7 +632,9 @@ def process_lai_data(
     elevation_bins: List[int],
     land_use_classes_of_interest: List[int] | None = None,
     aoi_boundary_file: str | None = None,
-    ) -> Tuple[pd.DataFrame, List[Union[List[str], np.ndarray, List[str]]]]:
+    return_modifying: bool = True,
+    year: int | None = None,
+    ) -> Tuple[pd.DataFrame, List[Union[List[Path], np.ndarray]] | None]:
     """
     Process LAI (Leaf Area Index) data and prepare it for analysis. This
     function handles reading, converting, resampling, and classifying LAI data
@@ -414,77 +662,98 @@ def process_lai_data(
         aoi_boundary_file (str or Path, optional): Path to the shapefile
           representing the area of interest (AOI). If provided, the land use
           raster will be cropped to this boundary.
+        return_modifying (bool, optional): Whether to return the data needed
+          for LAI modification. If False, None is returned instead and the
+          resampled LAI stack can be released as soon as the statistics are
+          calculated. Defaults to True.
+        year (int, optional): Process only the LAI files of this year. The
+          files are selected by the date in their names, before any raster
+          is read. Defaults to None, which means all files are processed.
 
     Returns:
         pd.DataFrame: A DataFrame containing the processed LAI data, filtered
           by land use classes of interest.
-        list: A list containing:
-          - unified_lai_list (List[str]): Paths to the resampled LAI files.
-          - unified_dem (str): Path to the resampled DEM file.
-          - elevation_labels (List[str]): List of elevation class labels.
+        list or None: If `return_modifying` is True, a list containing:
+          - converted_tiff_files_paths (List[Path]): Paths to the converted
+            LAI files.
+          - unified_lai_arrays (numpy.ndarray): The resampled LAI data as a
+            3D array (one layer per LAI file).
+          - unified_dem (numpy.ndarray): The resampled DEM data.
     """
-    # Obtain a list of raw LAI files from the specified folder
-    files_in_lai_folder = grab_raw_lai_data_files(Path(lai_folder_path))
-
-    # Convert raw LAI files from HDR to TIFF format
-    converted_tiff_files_paths = [
-        # await convert_hdr_to_tif for file_lai in files_in_lai_folder
-        convert_hdr_to_tif(file_lai) for file_lai in files_in_lai_folder
-    ]
-
-    # If aoi_boundary_file is not None, cut land_use_file_path using
-    #  aoi_boundary_file
-    if aoi_boundary_file is not None:
-        land_use_file_path = cut_land_use_file_path(
-            land_use_file_path, aoi_boundary_file
+    # Use a larger GDAL block cache and all CPU cores for the raster I/O
+    with rasterio.Env(
+        GDAL_CACHEMAX=DEFAULT_GDAL_CACHEMAX,
+        GDAL_NUM_THREADS=DEFAULT_GDAL_NUM_THREADS,
+    ):
+        # Obtain a list of raw LAI files from the specified folder
+        files_in_lai_folder = grab_raw_lai_data_files(Path(lai_folder_path))
+
+        # Keep only the files of the requested year
+        if year is not None:
+            files_in_lai_folder = [
+                lai_file
+                for lai_file in files_in_lai_folder
+                if extract_date_from_filename(lai_file).year == year
+            ]
+
+        # Convert raw LAI files from HDR to TIFF format, in parallel
+        converted_tiff_files_paths = convert_hdr_files_to_tif(
+            files_in_lai_folder
         )
 
-    # Create a template raster based on the land use raster
-    template_raster = create_template_raster(Path(land_use_file_path))
+        # If aoi_boundary_file is not None, cut land_use_file_path using
+        #  aoi_boundary_file
+        if aoi_boundary_file is not None:
+            land_use_file_path = cut_land_use_file_path(
+                land_use_file_path, aoi_boundary_file
+            )
 
-    # Resample the DEM raster to match the extent and resolution of the
-    # template raster
-    unified_dem = copy_data_to_template(
-        template_raster,
-        dem_file_path,
-        )
+        # Create a template raster based on the land use raster
+        template_raster = create_template_raster(Path(land_use_file_path))
 
-    # Resample the converted LAI rasters to match the template raster   
-    unified_lai_list = []
-    for converted_tiff_file in converted_tiff_files_paths:
-        unified_lai_list.append(
-            copy_data_to_template(
-                template_raster,
-                converted_tiff_file,
-                output_folder=DEFAULT_TEMP_LAI_DIR,
-            )
+        # Resample the DEM raster to match the extent and resolution of the
+        # template raster
+        unified_dem = copy_data_to_template_cached(
+            template_raster,
+            dem_file_path,
         )
 
-    # Classify the elevation data based on the specified elevation bins
-    elevation_classes, elevation_labels, new_elev_bins = classify_elevation(
-        unified_dem, elevation_bins
-    )
+        # Resample all converted LAI rasters to match the template raster
+        unified_lai_arrays = resample_rasters_to_template(
+            template_raster,
+            converted_tiff_files_paths,
+        )
 
-    # Process the LAI files and extract relevant data based on land use and
-    # elevation classes
-    data = process_lai_files_and_extract_data(
-        unified_lai_list,
-        land_use_file_path,
-        elevation_classes,
-        elevation_labels
-    )
+        # Classify the elevation data based on the specified elevation bins
+        (
+            elevation_classes,
+            elevation_labels,
+            new_elev_bins,
+        ) = classify_elevation(unified_dem, elevation_bins)
+
+        # Process the LAI files and extract relevant data for the land use
+        # classes of interest and elevation classes
+        data = process_lai_files_and_extract_data(
+            converted_tiff_files_paths,
+            unified_lai_arrays,
+            land_use_file_path,
+            elevation_classes,
+            elevation_labels,
+            land_use_classes_of_interest,
+        )
 
-    # Filter the extracted LAI data to include only the land use classes of
-    # interest
-    result_data_frame = filter_lai_data_by_landuse(
-                                                data,
-                                                land_use_classes_of_interest
-                                                )
+        # Create a DataFrame from the extracted LAI data
+        result_data_frame = create_lai_data_frame(data)
     
-    list_of_data_for_modifying = [
-                                unified_lai_list,
-                                unified_dem,
-                                ]
+        # Keep the resampled data only if they are needed for modification
+        if return_modifying:
+            list_of_data_for_modifying = [
+                                        converted_tiff_files_paths,
+                                        unified_lai_arrays,
+                                        unified_dem,
+                                        ]
+        else:
+            list_of_data_for_modifying = None
     
     return result_data_frame, list_of_data_for_modifying
 
@@ -495,7 +764,8 @@ def adjust_lai(
     elevation_array: np.ndarray,
     df: pd.DataFrame,
     elevation_list: List[str],
-    lai_file_name: str
+    lai_file_name: str,
+    cluster_index: Tuple[np.ndarray, ...] | None = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Adjusts LAI values based on land use and elevation classes specified in a
@@ -519,15 +789,39 @@ def adjust_lai(
           corresponding to raster classes.
         lai_file_name (str): Name of the LAI file used to extract the date
           for filtering.
+        cluster_index (tuple, optional): The pixels grouped by land use and
+          elevation class, as returned by `build_cluster_index` for
+          `landuse_array` and `elevation_array`. Since it is the same for all
+          LAI files, it can be built once and passed here. Defaults to None,
+          which means it is built by this function.
 
     Returns:
         Tuple[np.ndarray, np.ndarray]: The adjusted LAI array after applying 
           the specified modifications within the Q1-Q3 range, and a raster 
           with the unchanged values that did not pass the Q1-Q3 condition.
+
+    Notes:
+        - The pixels of every land use and elevation class are taken from
+          `cluster_index`, so the rasters are not compared with the classes
+          of every row of the DataFrame.
     """
 
+    # Group the pixels by land use and elevation class unless already done
+    if cluster_index is None:
+        cluster_index = build_cluster_index(
+            landuse_array,
+            elevation_array,
+            df['Landuse_current'].unique(),
+        )
+    order, cluster_landuse, cluster_elevation, starts, ends = cluster_index
+
+    # Work on flat views of the rasters, indexed by the cluster pixels
+    lai_array = np.ascontiguousarray(lai_array)
+    lai_flat = lai_array.reshape(-1)
+
     # Create an empty raster to store unchanged values
     unchanged_array = np.full_like(lai_array, np.nan)
+    unchanged_flat = unchanged_array.reshape(-1)
     
     # Extract the date from the LAI file name
     lai_date = extract_date_from_filename(lai_file_name)
@@ -546,34 +840,38 @@ def adjust_lai(
         q3_target = row["Q3_target"]
 
         # Find the cells where land use and elevation match the conditions
-        condition = (
-            landuse_array == landuse_current
-        ) & (
-            elevation_array == elev_class_index
+        cluster = np.flatnonzero(
+            (cluster_landuse == landuse_current)
+            & (cluster_elevation == elev_class_index)
         )
+        if cluster.size:
+            pixels = order[starts[cluster[0]]:ends[cluster[0]]]
+        else:
+            pixels = order[:0]
+        lai_values = lai_flat[pixels]
 
         # Modify the corresponding values in the LAI array
-        new_values = lai_array[condition] * diff
+        new_values = lai_values * diff
 
         # Apply the change only if the new value falls between Q1 and Q3
         valid_condition = (new_values >= q1_target) & (new_values <= q3_target)
 
         # Store unchanged values in the empty raster
-        unchanged_array[condition] = np.where(
+        unchanged_flat[pixels] = np.where(
             ~valid_condition,
-            lai_array[condition],
+            lai_values,
             np.nan
             )
 
         # Update the LAI array with valid changes
-        lai_array[condition] = np.where(
+        lai_flat[pixels] = np.where(
             valid_condition,
             new_values,
-            lai_array[condition]
+            lai_values
             )
 
         # Calculate the total number of pixels in this condition (Sum_of_pix)
-        sum_of_pix = np.sum(condition)
+        sum_of_pix = pixels.size
         
         # Calculate the number of unchanged pixels (Count_unchanged_pix)
         count_unchanged_pix = np.sum(~valid_condition)
@@ -586,7 +884,7 @@ def adjust_lai(
 
 
 def modification_lai_datas(
-    list_of_data_for_modifying: List[Union[List[Path], Path, List[str]]],
+    list_of_data_for_modifying: List[Union[List[Path], np.ndarray]],
     csv_for_modification: pd.DataFrame,
     elevation_bins: List[int]| None,
     land_use_path: Path
@@ -607,7 +905,8 @@ def modification_lai_datas(
     Parameters:
         list_of_data_for_modifying (list): A list containing:
           - [0]: List of Paths to LAI raster files to be modified.
-          - [1]: Path to the elevation raster file.
+          - [1]: The resampled LAI data of these files as a 3D array.
+          - [2]: The resampled elevation data.
         csv_for_modification (pd.DataFrame): DataFrame containing the CSV 
           file with LAI adjustment factors based on land use and elevation 
           classes.
@@ -621,69 +920,95 @@ def modification_lai_datas(
           rasters to a specified directory.
     """
 
-    elevation_classes, elevation_labels, new_elev_bins = classify_elevation( ##################################################################
-        list_of_data_for_modifying[1], elevation_bins
+    lai_file_paths, unified_lai_arrays, unified_dem = (
+        list_of_data_for_modifying
+    )
+
+    elevation_classes, elevation_labels, new_elev_bins = classify_elevation(
+        unified_dem, elevation_bins
     )
 
     # Use the template raster to resample the land use file
-    template_raster = DEFAULT_TEMP_DIR + "\\" + DEFAULT_TEMP_RASTER_NAME
+    template_raster = Path(DEFAULT_TEMP_DIR) / DEFAULT_TEMP_RASTER_NAME
 
     # Resample the land use data to match the template raster
-    unifited_landuse_path = copy_data_to_template(
+    unified_landuse = copy_data_to_template_cached(
         template_raster=template_raster,
         source_file=land_use_path,
-        output_folder=DEFAULT_TEMP_DIR,
-        filename=DEFAULT_TEMP_LANDUSE_NAME,
     )
 
-    # Read the resampled land use raster
-    unified_landuse = read_raster(unifited_landuse_path)
+    # Group the pixels by land use and elevation class once for all files
+    cluster_index = build_cluster_index(
+        unified_landuse,
+        elevation_classes,
+        csv_for_modification['Landuse_current'].unique(),
+    )
 
     # Define the output folder path for modified and unmodified LAI files
     output_folder_path_lai = ensure_directory_exists(DEFAULT_MODIFY_LAI_FOLDER)
     output_path_unchanged = ensure_directory_exists(DEFAULT_UNMODIFY_FOLDER)
 
-    # Loop through each LAI file to apply modifications
-    for lai_file_path in list_of_data_for_modifying[0]:
+    # Write the rasters in background threads (GDAL releases the GIL while
+    # writing), so the next file is adjusted while the previous one is saved
+    pending_writes = deque()
+    with ThreadPoolExecutor(max_workers=DEFAULT_RASTER_WRITERS) as writer:
+
+        # Loop through each LAI file to apply modifications
+        for lai_file_path, unified_lai in zip(
+            lai_file_paths, unified_lai_arrays
+        ):
+
+            # Copy the LAI data, since adjust_lai modifies it in place
+            lai_data = unified_lai.copy()
+
+            # Call the adjust_lai function with the corresponding LAI filename
+            lai_adjusted, unchanged_array= adjust_lai(
+                lai_data,
+                unified_landuse,
+                elevation_classes,
+                csv_for_modification,
+                elevation_labels,
+                lai_file_path,
+                cluster_index,
+            )
 
-        # Read the LAI raster data
-        lai_data = read_raster(lai_file_path)
+            # Extract the filename without the extension
+            filename_raw = lai_file_path.stem
+            # Split the filename and extract the first two parts
+            part1 = filename_raw.split('_')[0]
+            part2 = filename_raw.split('_')[1]
+            part_of_name = part1 + '_' + part2
+
+            # Construct the output path for the modified and unmodified LAI
+            # file
+            output_path_for_lai = output_folder_path_lai.joinpath(
+                f"modify_{part_of_name}.tif"
+                )
+            output_path_unchanged_lai = output_path_unchanged.joinpath(
+                f"unmodify_{part_of_name}.tif"
+                )
 
-        # Call the adjust_lai function with the corresponding LAI filename
-        lai_adjusted, unchanged_array= adjust_lai(
-            lai_data,
-            unified_landuse,
-            elevation_classes,
-            csv_for_modification,
-            elevation_labels,
-            lai_file_path
-        )
+            # Wait for the oldest writes if too many rasters are waiting
+            while len(pending_writes) >= DEFAULT_MAX_PENDING_WRITES:
+                pending_writes.popleft().result()
 
-        # Extract the filename without the extension
-        filename_raw = lai_file_path.stem
-        # Split the filename and extract the first two parts
-        part1 = filename_raw.split('_')[0]
-        part2 = filename_raw.split('_')[1]
-        part_of_name = part1 + '_' + part2
+            # Save the adjusted LAI data and unmodified data to a new raster
+            # file
+            pending_writes.append(writer.submit(
+                save_lai_to_raster,
+                lai_adjusted,
+                template_raster,
+                output_path_for_lai
+                ))
+            pending_writes.append(writer.submit(
+                save_lai_to_raster,
+                unchanged_array,
+                template_raster,
+                output_path_unchanged_lai,
+                ))
 
-        # Construct the output path for the modified and unmodified LAI file
-        output_path_for_lai = output_folder_path_lai.joinpath(
-            f"modify_{part_of_name}.tif"
-            )
-        output_path_unchanged_lai = output_path_unchanged.joinpath(
-            f"unmodify_{part_of_name}.tif"
-            )
+        # Wait for the remaining writes and raise their errors
+        while pending_writes:
+            pending_writes.popleft().result()
 
-        # Save the adjusted LAI data and unmodified data to a new raster file
-        save_lai_to_raster(
-            lai_adjusted,
-            template_raster,
-            output_path_for_lai
-            )
-        save_lai_to_raster(
-            unchanged_array,
-            template_raster,
-            output_path_unchanged_lai,
-            )
-    
     return csv_for_modification
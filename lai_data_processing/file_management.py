@@ -1,12 +1,18 @@
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import re
 import shutil
-from typing import List
+from typing import Iterator, List
 
 from decorators import measure_time
 
 
 DEFAULT_TEMP_DIR = "temp"
+# Number of parsed CSV filenames kept by `extract_data_from_csv_filename`
+DEFAULT_FILENAME_CACHE_SIZE = 4096
+# Pattern of the CSV files written by `create_stat_lai_by_clusters`
+CSV_FILENAME_PATTERN = re.compile(r"lai_data_\d+_(\d+)_(\d+-\d+)\.csv")
 
 
 def ensure_directory_exists(directory_path: str) -> Path:
@@ -54,6 +60,7 @@ def remove_directory_if_needed(
         if temp_folder.exists() and temp_folder.is_dir():
             shutil.rmtree(temp_folder)
 
+
 @measure_time
 def grab_raw_lai_data_files(path: Path) -> List[Path]:
     """
@@ -79,6 +86,35 @@ def grab_raw_lai_data_files(path: Path) -> List[Path]:
     return files_without_extension
 
 
+@contextmanager
+def temp_workspace(
+    should_remove_temp: bool,
+    temp_path: str = DEFAULT_TEMP_DIR,
+) -> Iterator[Path]:
+    """
+    Provides the temporary directory for a processing run and removes it
+    afterwards if requested.
+
+    Parameters:
+        should_remove_temp (bool): Flag indicating whether the directory should
+          be removed when the block is left.
+        temp_path (str, optional): Path to the temporary directory.
+          Defaults to "temp".
+
+    Yields:
+        Path: The Path object of the temporary directory.
+
+    Notes:
+        - The directory is removed even if the block raises an exception, so
+          a failed run does not leave stale temporary rasters behind.
+    """
+    try:
+        yield Path(temp_path)
+    finally:
+        remove_directory_if_needed(should_remove_temp, temp_path)
+
+
+@lru_cache(maxsize=DEFAULT_FILENAME_CACHE_SIZE)
 def extract_data_from_csv_filename(filename: str) -> tuple[int, str]:
     """
     Extract the land use class and elevation class from a CSV filename.
@@ -99,12 +135,16 @@ def extract_data_from_csv_filename(filename: str) -> tuple[int, str]:
     Raises:
         ValueError: If the filename does not match the expected pattern.
     
+    Notes:
+        - The results are cached, so comparing the same files again does not
+          parse their names again.
+
     Example:
         >>> extract_data_from_csv_filename('lai_data_2021_3_400-500.csv')
         (3, '400-500')
     """
     # Use regex to extract land use and elevation class from the filename
-    match = re.search(r'lai_data_\d+_(\d+)_(\d+-\d+)\.csv', filename)
+    match = CSV_FILENAME_PATTERN.search(filename)
     
     # If a match is found, extract land use and elevation classes
     if match:
@@ -1,9 +1,12 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
 from typing import List
 
 import numpy as np
 import pandas as pd
 import rasterio
 
+from cache import load_lai_data
 from csv_processing import (
     save_data_to_csv,
     create_stat_lai_by_clusters,
@@ -15,7 +18,7 @@ from data_processing import (process_lai_data,
                              extract_date_from_filename,
                              modification_lai_datas)
 from decorators import measure_time
-from file_management import remove_directory_if_needed
+from file_management import temp_workspace
 from plotting import (
     plot_lai_by_landuse_and_elevation,
     plot_lai_by_landuse_and_elevation_for_year,
@@ -25,6 +28,18 @@ from raster_processing import read_raster
 
 
 DEFAULT_CSV_MODIFICATION_FILENAME = "lai_modification.csv"
+ANALYSIS_TASKS = (
+    "csv",
+    "day_of_year_csv",
+    "clusters_csv",
+    "plot",
+    "plot_for_year",
+    "plot_for_year_with_q1_q3_med_min_max",
+)
+DEFAULT_ALL_ANALYSIS_TASKS = ("csv", "day_of_year_csv", "clusters_csv", "plot")
+
+# The processed LAI data of a worker process of run_lai_analysis_tasks
+_worker_data_frame = None
 
 
 def run_calculate_and_save_mean_lai_by_period(
@@ -58,24 +73,22 @@ def run_calculate_and_save_mean_lai_by_period(
     Returns:
         None: The results are saved to a CSV file.
     """
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
-
-    if is_clusters:
-        # Save the mean LAI values by period to a CSV file
-        create_stat_lai_by_clusters(data_frame)
-    else:
-        save_data_to_csv(data_frame)
-
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+    with temp_workspace(should_remove_temp):
+        # Process LAI data files and extract relevant information
+        data_frame = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+        ).data_frame
+
+        if is_clusters:
+            # Save the mean LAI values by period to a CSV file
+            create_stat_lai_by_clusters(data_frame)
+        else:
+            save_data_to_csv(data_frame)
 
 
 def run_calculate_and_save_mean_lai_by_day_of_year(
@@ -106,21 +119,19 @@ def run_calculate_and_save_mean_lai_by_day_of_year(
     Returns:
         None: The results are saved to a CSV file.
     """
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
-
-    # Save the mean LAI values by day of year to a CSV file
-    create_stat_lai_by_day_of_year(data_frame)
+    with temp_workspace(should_remove_temp):
+        # Process LAI data files and extract relevant information
+        data_frame = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+        ).data_frame
 
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+        # Save the mean LAI values by day of year to a CSV file
+        create_stat_lai_by_day_of_year(data_frame)
 
 
 def run_plot_lai_by_landuse_and_elevation(
@@ -151,21 +162,19 @@ def run_plot_lai_by_landuse_and_elevation(
     Returns:
         None: The plots are saved as PNG files.
     """
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
-
-    # Plot LAI values by land use and elevation class
-    plot_lai_by_landuse_and_elevation(data_frame)
+    with temp_workspace(should_remove_temp):
+        # Process LAI data files and extract relevant information
+        data_frame = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+        ).data_frame
 
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+        # Plot LAI values by land use and elevation class
+        plot_lai_by_landuse_and_elevation(data_frame)
 
 
 def run_plot_lai_by_landuse_and_elevation_for_year(
@@ -203,22 +212,23 @@ def run_plot_lai_by_landuse_and_elevation_for_year(
     Returns:
         None: The plots are saved as PNG files.
     """
-
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
-
-    # Plot LAI values by land use and elevation class
-    plot_lai_by_landuse_and_elevation_for_year(data_frame, display_datas, year)
-
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+    with temp_workspace(should_remove_temp):
+
+        # Process the LAI data files of the plotted year only
+        data_frame = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+            year=year,
+        ).data_frame
+
+        # Plot LAI values by land use and elevation class
+        plot_lai_by_landuse_and_elevation_for_year(
+            data_frame, display_datas, year
+        )
 
 
 # @measure_time
@@ -254,25 +264,24 @@ def run_plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
     Returns:
         None: The plots are saved as PNG files.
     """
-
-    # Process LAI data files and extract relevant information
-    data_frame, unified_lai_list, unified_dem = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
-
-    # Plot LAI values by land use and elevation class
-    plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
-        data_frame,
-        year
-        )
-
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+    with temp_workspace(should_remove_temp):
+
+        # Process the LAI data files of the plotted year only
+        data_frame = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+            year=year,
+        ).data_frame
+
+        # Plot LAI values by land use and elevation class
+        plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
+            data_frame,
+            year
+            )
 
 
 def run_all_lai_analysis(
@@ -283,6 +292,7 @@ def run_all_lai_analysis(
     land_use_classes_of_interest: List[int] | None = None,
     aoi_boundary_file: str | None = None,
     should_remove_temp: bool = True,
+    max_workers: int | None = None,
 ) -> None:
     """
     Perform a comprehensive analysis of LAI data including processing, saving
@@ -300,34 +310,251 @@ def run_all_lai_analysis(
           area of interest. If None, the entire area is analyzed.
         should_remove_temp (bool): Whether to remove temporary files and
           directories created during processing. Defaults to True.
+        max_workers (int, optional): Number of worker processes used to
+          create the CSV files and plots in parallel. Defaults to None, which
+          means the number of CPUs.
 
     Returns:
         None: The results are saved to CSV files and plots are generated.
     """
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
+    run_lai_analysis_tasks(
+        DEFAULT_ALL_ANALYSIS_TASKS,
+        lai_folder_path=lai_folder_path,
+        land_use_path=land_use_path,
+        dem_file_path=dem_file_path,
+        elevation_bins=elevation_bins,
+        land_use_classes_of_interest=land_use_classes_of_interest,
+        aoi_boundary_file=aoi_boundary_file,
+        should_remove_temp=should_remove_temp,
+        max_workers=max_workers,
+    )
+
+
+def _run_analysis_task(
+    task: str,
+    data_frame: pd.DataFrame,
+    year: int | None,
+    display_datas: List[str] | None,
+    plot_workers: int | None = None,
+) -> None:
+    """
+    Run a single analysis task of `run_lai_analysis_tasks`.
+
+    The function is defined at module level, so that it can be sent to the
+    worker processes.
+
+    Parameters:
+        task (str): Name of the task, one of `ANALYSIS_TASKS`.
+        data_frame (pd.DataFrame): The processed LAI data.
+        year (int or None): The year used by the per-year plots.
+        display_datas (List[str] or None): Columns plotted by
+          "plot_for_year".
+        plot_workers (int, optional): Number of worker processes used by the
+          plotting functions. Defaults to None, which means the number of
+          CPUs.
+
+    Returns:
+        None
+    """
+    if task == "csv":
+        # Save mean LAI values by period to a CSV file
+        save_data_to_csv(data_frame)
+    elif task == "day_of_year_csv":
+        # Save mean LAI values by day of year to a CSV file
+        create_stat_lai_by_day_of_year(data_frame)
+    elif task == "clusters_csv":
+        # Save mean LAI values by clusters to a CSV file
+        create_stat_lai_by_clusters(data_frame)
+    elif task == "plot":
+        # Generate plots of LAI by land use and elevation class
+        plot_lai_by_landuse_and_elevation(
+            data_frame, max_workers=plot_workers
+        )
+    elif task == "plot_for_year":
+        plot_lai_by_landuse_and_elevation_for_year(
+            data_frame, display_datas, year, max_workers=plot_workers
+        )
+    elif task == "plot_for_year_with_q1_q3_med_min_max":
+        plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
+            data_frame,
+            year,
+            max_workers=plot_workers,
+            )
+
+
+def _init_analysis_worker(data_frame: pd.DataFrame) -> None:
+    """
+    Store the processed LAI data in a worker process of
+    `run_lai_analysis_tasks`.
+
+    Parameters:
+        data_frame (pd.DataFrame): The processed LAI data.
+
+    Returns:
+        None
+
+    Notes:
+        - With the "fork" start method (the default on Linux) the worker
+          inherits the DataFrame from the parent process without pickling.
+          Otherwise it is pickled once per worker rather than once per task.
+    """
+    global _worker_data_frame
+    _worker_data_frame = data_frame
+
+
+def _run_worker_analysis_task(
+    task: str,
+    year: int | None,
+    display_datas: List[str] | None,
+) -> None:
+    """
+    Run a single analysis task on the DataFrame stored by
+    `_init_analysis_worker`.
+
+    Parameters:
+        task (str): Name of the task, one of `ANALYSIS_TASKS`.
+        year (int or None): The year used by the per-year plots.
+        display_datas (List[str] or None): Columns plotted by
+          "plot_for_year".
+
+    Returns:
+        None
+
+    Notes:
+        - The plots of a task are rendered in this worker only, so the task
+          pool does not start a further pool of `os.cpu_count()` processes
+          per plot task.
+    """
+    _run_analysis_task(
+        task, _worker_data_frame, year, display_datas, plot_workers=1
     )
 
-    # Save mean LAI values by period to a CSV file
-    save_data_to_csv(data_frame)
 
-    # Save mean LAI values by day of year to a CSV file
-    create_stat_lai_by_day_of_year(data_frame)
+def run_lai_analysis_tasks(
+    tasks: List[str],
+    data_frame: pd.DataFrame | None = None,
+    lai_folder_path: str | None = None,
+    land_use_path: str | None = None,
+    dem_file_path: str | None = None,
+    elevation_bins: List[int] | None = None,
+    land_use_classes_of_interest: List[int] | None = None,
+    aoi_boundary_file: str | None = None,
+    year: int | None = None,
+    display_datas: List[str] | None = None,
+    should_remove_temp: bool = True,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Run several analysis tasks on a single processed LAI DataFrame.
+
+    The raster processing is by far the most expensive step, so it is done
+    only once (or not at all if `data_frame` is given) and all requested
+    CSV files and plots are created from the same DataFrame. The tasks are
+    independent of each other, so they are run in parallel worker processes.
+
+    Parameters:
+        tasks (List[str]): Names of the tasks to run, in order. Available
+          tasks are listed in `ANALYSIS_TASKS`:
+          - "csv": save all LAI data to a single CSV file.
+          - "day_of_year_csv": save mean LAI values by day of year.
+          - "clusters_csv": save LAI values of every cluster and year to
+            separate CSV files.
+          - "plot": plot LAI by land use and elevation class.
+          - "plot_for_year": plot `display_datas` for `year`.
+          - "plot_for_year_with_q1_q3_med_min_max": plot the boxplot
+            statistics for `year`.
+        data_frame (pd.DataFrame, optional): Already processed LAI data, as
+          returned by this function or `load_lai_data`. If None, the data are
+          processed from the input files given below.
+        lai_folder_path (str, optional): Path to the folder containing LAI
+          data files.
+        land_use_path (str, optional): Path to the land use raster file.
+        dem_file_path (str, optional): Path to the digital elevation model
+          (DEM) file.
+        elevation_bins (List[int], optional): Elevation bins for
+          classification.
+        land_use_classes_of_interest (Optional[List[int]]): List of land use
+         classes to include in the analysis. If None, all classes are included.
+        aoi_boundary_file (Optional[str]): Path to a boundary file defining the
+          area of interest. If None, the entire area is analyzed.
+        year (int, optional): The year used by the per-year plots.
+        display_datas (List[str], optional): Columns plotted by
+          "plot_for_year". Defaults to ['Q1', 'Q3'].
+        should_remove_temp (bool): Whether to remove temporary files and
+          directories created during processing. Defaults to True.
+        max_workers (int, optional): Number of worker processes for the
+          tasks. Defaults to None, which means the number of CPUs. With 1 the
+          tasks are run in the current process, in the given order, and the
+          plotting functions render in parallel themselves. Otherwise every
+          task renders its plots in its own worker process.
+
+    Returns:
+        pd.DataFrame: The processed LAI data, which can be passed to further
+          calls of this function.
 
-    # Save mean LAI values by clusters to a CSV file
-    create_stat_lai_by_clusters(data_frame)
+    Raises:
+        ValueError: If an unknown task is requested, or if neither
+          `data_frame` nor the input files are given.
+    """
+    unknown_tasks = [task for task in tasks if task not in ANALYSIS_TASKS]
+    if unknown_tasks:
+        raise ValueError(
+            f"Unknown analysis tasks {unknown_tasks}, "
+            f"available tasks are {list(ANALYSIS_TASKS)}"
+        )
 
-    # Generate plots of LAI by land use and elevation class
-    plot_lai_by_landuse_and_elevation(data_frame)
+    if data_frame is None and None in (
+        lai_folder_path,
+        land_use_path,
+        dem_file_path,
+    ):
+        raise ValueError(
+            "Either data_frame or lai_folder_path, land_use_path and "
+            "dem_file_path must be given"
+        )
 
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+    with temp_workspace(should_remove_temp):
+        if data_frame is None:
+            # Process LAI data files and extract relevant information
+            data_frame = load_lai_data(
+                lai_folder_path,
+                land_use_path,
+                dem_file_path,
+                elevation_bins,
+                land_use_classes_of_interest,
+                aoi_boundary_file,
+            ).data_frame
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(tasks))
+
+        if max_workers <= 1:
+            for task in tasks:
+                _run_analysis_task(task, data_frame, year, display_datas)
+        else:
+            # The tasks write different files, so they can run side by side.
+            # The DataFrame is handed to every worker once, when it starts,
+            # instead of being pickled along with every task
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_analysis_worker,
+                initargs=(data_frame,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_worker_analysis_task,
+                        task,
+                        year,
+                        display_datas,
+                    )
+                    for task in tasks
+                ]
+                # Re-raise the first error of the workers, if any
+                for future in futures:
+                    future.result()
+
+    return data_frame
 
 
 def run_lai_modification(
@@ -361,39 +588,41 @@ def run_lai_modification(
     Returns:
         None: The modified LAI data is saved as a new raster file.
     """
-    land_use_classes_of_interest = [
-        current_landuse_class,
-        target_landuse_class
-    ]
-
-    # Process LAI data files and extract relevant information
-    data_frame, list_of_data_for_modifying = process_lai_data(
-        lai_folder_path,
-        land_use_path,
-        dem_file_path,
-        elevation_bins,
-        land_use_classes_of_interest,
-        aoi_boundary_file,
-    )
+    with temp_workspace(should_remove_temp):
+        land_use_classes_of_interest = [
+            current_landuse_class,
+            target_landuse_class
+        ]
+
+        # Process LAI data files and extract relevant information
+        lai_result = load_lai_data(
+            lai_folder_path,
+            land_use_path,
+            dem_file_path,
+            elevation_bins,
+            land_use_classes_of_interest,
+            aoi_boundary_file,
+            require_temp_files=True,
+        )
 
-    # Create a CSV file that contains information for modifying LAI values
-    csv_for_modification = create_lai_modification_csv(
-        data_frame,
-        current_landuse_class,
-        target_landuse_class
-    )
+        # Create a CSV file that contains information for modifying LAI values
+        csv_for_modification = create_lai_modification_csv(
+            lai_result.data_frame,
+            current_landuse_class,
+            target_landuse_class
+        )
 
     
 
-    # Apply the modifications to the LAI data
-    updated_csv_for_modification = modification_lai_datas(
-                            list_of_data_for_modifying,
-                            csv_for_modification,
-                            elevation_bins,
-                            land_use_path
-                            )
+        # Apply the modifications to the LAI data
+        updated_csv_for_modification = modification_lai_datas(
+                                lai_result.list_of_data_for_modifying,
+                                csv_for_modification,
+                                elevation_bins,
+                                land_use_path
+                                )
     
-    save_data_to_csv(updated_csv_for_modification, DEFAULT_CSV_MODIFICATION_FILENAME)
-
-    # Call the function to remove the directory if `should_remove_temp` is True
-    remove_directory_if_needed(should_remove_temp)
+        save_data_to_csv(
+            updated_csv_for_modification,
+            DEFAULT_CSV_MODIFICATION_FILENAME,
+        )
@@ -0,0 +1,118 @@
+from contextlib import ExitStack
+from typing import List
+
+from cache import load_lai_data
+from file_management import temp_workspace
+from main import run_lai_analysis_tasks
+
+
+class LaiPipeline:
+    """
+    Process LAI data once and run any number of analysis tasks on the result.
+
+    The pipeline is a context manager around `load_lai_data` and
+    `run_lai_analysis_tasks`. The data are processed when the block is
+    entered and the temporary files are removed when it is left, even if a
+    task raises an exception.
+
+    Parameters:
+        lai_folder_path (str): Path to the folder containing LAI data files.
+        land_use_path (str): Path to the land use raster file.
+        dem_file_path (str): Path to the digital elevation model (DEM) file.
+        elevation_bins (List[int]): Elevation bins for classification.
+        land_use_classes_of_interest (Optional[List[int]]): List of land use
+         classes to include in the analysis. If None, all classes are included.
+        aoi_boundary_file (Optional[str]): Path to a boundary file defining the
+          area of interest. If None, the entire area is analyzed.
+        should_remove_temp (bool): Whether to remove temporary files and
+          directories created during processing when the block is left.
+          Defaults to True.
+
+    Attributes:
+        data_frame (pd.DataFrame): The processed LAI data. None until the
+          block is entered.
+
+    Notes:
+        - Usage:
+
+          with LaiPipeline(lai_folder, land_use, dem, bins) as pipeline:
+              pipeline.run(["day_of_year_csv", "plot"])
+    """
+
+    def __init__(
+        self,
+        lai_folder_path: str,
+        land_use_path: str,
+        dem_file_path: str,
+        elevation_bins: List[int],
+        land_use_classes_of_interest: List[int] | None = None,
+        aoi_boundary_file: str | None = None,
+        should_remove_temp: bool = True,
+    ) -> None:
+        self.lai_folder_path = lai_folder_path
+        self.land_use_path = land_use_path
+        self.dem_file_path = dem_file_path
+        self.elevation_bins = elevation_bins
+        self.land_use_classes_of_interest = land_use_classes_of_interest
+        self.aoi_boundary_file = aoi_boundary_file
+        self.should_remove_temp = should_remove_temp
+        self.data_frame = None
+        self._exit_stack = ExitStack()
+
+    def __enter__(self) -> "LaiPipeline":
+        # Remove the temporary files even if the processing fails
+        with ExitStack() as exit_stack:
+            exit_stack.enter_context(temp_workspace(self.should_remove_temp))
+
+            # Process LAI data files and extract relevant information
+            self.data_frame = load_lai_data(
+                self.lai_folder_path,
+                self.land_use_path,
+                self.dem_file_path,
+                self.elevation_bins,
+                self.land_use_classes_of_interest,
+                self.aoi_boundary_file,
+            ).data_frame
+
+            self._exit_stack = exit_stack.pop_all()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._exit_stack.__exit__(exc_type, exc_value, traceback)
+
+    def run(
+        self,
+        tasks: List[str],
+        year: int | None = None,
+        display_datas: List[str] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Run several analysis tasks on the processed data (see
+        `run_lai_analysis_tasks` for the available tasks).
+
+        Parameters:
+            tasks (List[str]): Names of the tasks to run.
+            year (int, optional): The year used by the per-year plots.
+            display_datas (List[str], optional): Columns plotted by
+              "plot_for_year".
+            max_workers (int, optional): Number of worker processes.
+              Defaults to None, which means the number of CPUs.
+
+        Raises:
+            RuntimeError: If the pipeline is used outside of a `with` block.
+        """
+        if self.data_frame is None:
+            raise RuntimeError(
+                "LaiPipeline must be used as a context manager"
+            )
+
+        run_lai_analysis_tasks(
+            tasks,
+            data_frame=self.data_frame,
+            year=year,
+            display_datas=display_datas,
+            should_remove_temp=False,
+            max_workers=max_workers,
+        )
@@ -1,8 +1,42 @@
-from typing import List
-
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+import os
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+import matplotlib
+import matplotlib.image
+
+# Use the non-interactive backend, plots are only saved to files
+matplotlib.use("Agg")
+
+# Simplify paths more aggressively (below one pixel the difference is not
+# visible), draw long paths in chunks and do not warn about many figures
+matplotlib.rcParams.update(
+    {
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        "figure.max_open_warning": 0,
+    }
+)
+
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+# pyarrow is optional; it is only used to speed up reading of CSV files
+try:
+    import pyarrow
+    CSV_READ_ENGINE = "pyarrow"
+except ImportError:
+    CSV_READ_ENGINE = "c"
+
 from decorators import measure_time
 from file_management import (
                             ensure_directory_exists,
@@ -14,6 +48,18 @@ DEFAULT_DISPLAY_DATA = "Mean_LAI"
 DEFAULT_PLOT_OUTPUT_DIR = "results\\png"
 DEFAULT_PLOT_COMPARE_OUTPUT_DIR = "results\\png_compare" 
 DEFAULT_DISPLAY_DATAS = ["Min", "Q1", "Median", "Q3", "Max",]
+# Columns of the LAI CSV files used by `plot_comparison_of_two_lai_datasets`
+COMPARE_COLUMNS = ["Date", *DEFAULT_DISPLAY_DATAS]
+# Resolution of the PNG plots; 72 DPI roughly halves the number of pixels
+# and the time to encode them, e.g. for quick previews
+DEFAULT_PLOT_DPI = 100
+# The fastest zlib level: PNG files get somewhat larger, but are written
+# several times faster (the pixels are the same)
+DEFAULT_PNG_PIL_KWARGS = {"compress_level": 1}
+# Number of threads encoding PNG files in the background and the number of
+# drawn plots that may wait for them
+DEFAULT_PNG_WRITERS = 2
+DEFAULT_PNG_QUEUE_SIZE = 8
 DEFAULT_COLOR_SCHEME = {
     "diagram1": {
                     "color_min_max": "black",
@@ -27,11 +73,202 @@ DEFAULT_COLOR_SCHEME = {
                 }
 }
 
+# Line style of each statistical measure in `plot_single_lai_graph`; the
+# "color" entries name the color of the color scheme that is used
+DEFAULT_MEASURE_STYLES = {
+    "Min": {"color": "color_min_max", "linestyle": "-", "linewidth": 0.5},
+    "Max": {"color": "color_min_max", "linestyle": "-", "linewidth": 0.5},
+    "Median": {"color": "color_median", "linestyle": "-", "linewidth": 2},
+}
+# Measures drawn as the shaded area instead of a line
+SHADED_MEASURES = frozenset({"Q1", "Q3"})
+
+
+def add_date_columns(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the year and the day of the year of the 'Date' column as separate
+    columns.
+
+    The plotting functions need the year and the day of the year of every
+    row. Deriving them once for the whole DataFrame is much cheaper than
+    calling the `.dt` accessors again for every plotted group.
+
+    Parameters:
+        data_frame (pd.DataFrame): A DataFrame containing LAI data with the
+          'Date' column in datetime format.
+
+    Returns:
+        pd.DataFrame: A new DataFrame with the additional columns 'Year' and
+          'DOY' (day of the year), both of type int16.
+
+    Notes:
+        - Columns that are already present are not calculated again, so the
+          function can be called repeatedly on the same DataFrame.
+    """
+    date_columns = {}
+    if "Year" not in data_frame.columns:
+        date_columns["Year"] = data_frame["Date"].dt.year.astype(np.int16)
+    if "DOY" not in data_frame.columns:
+        date_columns["DOY"] = data_frame["Date"].dt.dayofyear.astype(
+            np.int16
+        )
+
+    return data_frame.assign(**date_columns)
+
+
+def _select_year(
+    data_frame: pd.DataFrame, year: int | None
+) -> pd.DataFrame:
+    """
+    Select the rows of a single year from a DataFrame with LAI data.
+
+    Parameters:
+        data_frame (pd.DataFrame): A DataFrame containing the 'Date' column
+          in datetime format or the 'Year' column.
+        year (int or None): The year to select.
+
+    Returns:
+        pd.DataFrame: The rows of the given year. Empty if `year` is None.
+
+    Notes:
+        - The 'Year' column is used if present, otherwise the year is taken
+          from the 'Date' column, so the years of the whole DataFrame do not
+          have to be calculated first.
+        - If the DataFrame is sorted by date (as the output of
+          `process_lai_data` is), the rows are found with a binary search and
+          returned as a slice. Otherwise a boolean mask is used.
+    """
+    # No date belongs to a missing year
+    if year is None:
+        return data_frame.iloc[0:0]
+
+    if "Year" in data_frame.columns:
+        years = data_frame["Year"]
+        if years.is_monotonic_increasing:
+            start = years.searchsorted(year, side="left")
+            end = years.searchsorted(year, side="right")
+            return data_frame.iloc[start:end]
+        return data_frame[years.to_numpy() == year]
+
+    dates = data_frame["Date"]
+    if dates.is_monotonic_increasing:
+        # Find the first dates of the year and of the following year
+        start, end = dates.searchsorted(
+            [pd.Timestamp(year, 1, 1), pd.Timestamp(year + 1, 1, 1)]
+        )
+        return data_frame.iloc[start:end]
+    return data_frame[(dates.dt.year == year).to_numpy()]
+
+
+def _render_in_parallel(
+    render_function,
+    plot_tasks: List[tuple],
+    max_workers: int | None = None,
+) -> None:
+    """
+    Render plots with `render_function`, in parallel worker processes if more
+    than one worker is available.
+
+    Parameters:
+        render_function (callable): A module-level function that renders and
+          saves a list of plot tasks.
+        plot_tasks (List[tuple]): The plot tasks passed to `render_function`.
+        max_workers (int, optional): Number of worker processes. Defaults to
+          None, which means the number of CPUs. With 1 the plots are rendered
+          in the current process.
+
+    Returns:
+        None
+
+    Notes:
+        - Every worker gets batches of plots, so that it can reuse one figure
+          for all plots of a batch.
+    """
+    if not plot_tasks:
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(plot_tasks))
+
+    if max_workers == 1:
+        render_function(plot_tasks)
+        return
+
+    batch_size = -(-len(plot_tasks) // (4 * max_workers))
+    plot_batches = [
+        plot_tasks[i:i + batch_size]
+        for i in range(0, len(plot_tasks), batch_size)
+    ]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so that errors in workers are raised
+        list(executor.map(render_function, plot_batches))
+
+
+@contextmanager
+def _background_png_writer(
+    max_workers: int = DEFAULT_PNG_WRITERS,
+    max_pending: int = DEFAULT_PNG_QUEUE_SIZE,
+) -> Iterator[Callable[[Figure, Path], None]]:
+    """
+    Write PNG files in background threads while the next plots are drawn.
+
+    Parameters:
+        max_workers (int, optional): Number of threads encoding PNG files.
+          Defaults to `DEFAULT_PNG_WRITERS`.
+        max_pending (int, optional): Maximum number of drawn plots waiting
+          to be written; when it is reached, drawing waits for the oldest
+          one. Defaults to `DEFAULT_PNG_QUEUE_SIZE`.
+
+    Yields:
+        Callable[[Figure, Path], None]: A function that draws a figure and
+          writes it to the given PNG file in the background.
+
+    Notes:
+        - The pixels of the figure are copied before it is written, so the
+          figure can be cleared and reused right away.
+        - The files are the same as written by `figure.savefig`; the
+          encoding releases the GIL, so it overlaps with drawing.
+        - All files are written when the block is left, and errors of the
+          writers are raised.
+    """
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def save_png(figure: Figure, plot_file_path: Path) -> None:
+            # Wait for the oldest plot if too many plots are waiting
+            if len(pending) >= max_pending:
+                pending.popleft().result()
+
+            # Draw the figure and copy its pixels
+            figure.canvas.draw()
+            pixels = np.array(figure.canvas.buffer_rgba())
+
+            pending.append(
+                executor.submit(
+                    matplotlib.image.imsave,
+                    plot_file_path,
+                    pixels,
+                    format="png",
+                    dpi=figure.dpi,
+                    pil_kwargs=dict(DEFAULT_PNG_PIL_KWARGS),
+                )
+            )
+
+        yield save_png
+
+        # Raise errors of the remaining writers
+        while pending:
+            pending.popleft().result()
+
 
 def plot_lai_by_landuse_and_elevation(
     data_frame: pd.DataFrame,
     display_data: str = DEFAULT_DISPLAY_DATA,
     results_folder_png: str = DEFAULT_PLOT_OUTPUT_DIR,
+    max_workers: int | None = None,
+    dpi: int = DEFAULT_PLOT_DPI,
 ) -> None:
     """
     Generates and saves plots of Leaf Area Index (LAI) data by land use and
@@ -50,6 +287,11 @@ def plot_lai_by_landuse_and_elevation(
           "Mean_LAI".
         results_folder_png (str): The path to the folder where the PNG plot
            files will be saved. The default is 'results/png'.
+        max_workers (int, optional): Number of worker processes used to
+          render the plots. Defaults to None, which means the number of CPUs.
+          With 1 the plots are rendered in the current process.
+        dpi (int, optional): Resolution of the PNG plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
 
     Returns:
         None
@@ -59,42 +301,121 @@ def plot_lai_by_landuse_and_elevation(
           and elevation class.
         - The resulting plots are saved as PNG files in the specified folder,
           with filenames indicating the land use and elevation classes.
+        - The plots are independent of each other, so they are rendered in
+          parallel in a process pool. On Windows the calling script must
+          therefore be guarded with `if __name__ == "__main__":`.
+        - The PNG files are compressed with the fastest zlib level (see
+          `DEFAULT_PNG_PIL_KWARGS`), which makes them larger but much faster
+          to write.
     """
-    # Iterate over each combination of land use and elevation class
-    for (landuse_class, elevation_class), group_data in data_frame.groupby(
-        ["Landuse", "Elevation_class"]
-    ):
-        plt.figure(figsize=(10, 6))
-
-        # Plot LAI for each year
-        for year, year_data in group_data.groupby(data_frame["Date"].dt.year):
-            plt.plot(
-                year_data["Date"].dt.dayofyear,
-                year_data[display_data],
-                label=f"Year {year}",
-            )
+    # Ensure the results folder exists
+    results_folder_png_path = ensure_directory_exists(results_folder_png)
 
-        # Set plot titles and labels
-        plt.title(
-            f"LAI for Landuse {landuse_class} and "
-            f"Elevation {elevation_class} ({display_data})"
+    # Calculate the year and the day of the year once for the whole DataFrame
+    # and keep only the columns needed for plotting
+    plot_data = add_date_columns(data_frame)[
+        ["Landuse", "Elevation_class", "Year", "DOY", display_data]
+    ]
+
+    # Collect the data of each combination of land use and elevation class
+    plot_tasks = [
+        (
+            landuse_class,
+            elevation_class,
+            group_data,
+            display_data,
+            results_folder_png_path,
+        )
+        for (landuse_class, elevation_class), group_data in plot_data.groupby(
+            ["Landuse", "Elevation_class"], sort=False, observed=True
         )
-        plt.xlabel("Day of Year")
-        plt.ylabel("LAI")
-        plt.legend()
+    ]
+    # Render the plots, in parallel if more than one worker is available
+    _render_in_parallel(
+        partial(_render_lai_plots, dpi=dpi), plot_tasks, max_workers
+    )
 
-        # Ensure the results folder exists
-        results_folder_png_path = ensure_directory_exists(results_folder_png)
 
-        # Define the path for saving the plot
-        plot_file_path = (
-            results_folder_png_path / f"lai_plot_landuse_{landuse_class}_"
-            f"elevation_{elevation_class}.png"
-        )
+def _render_lai_plots(
+    plot_tasks: List[tuple],
+    dpi: int = DEFAULT_PLOT_DPI,
+) -> None:
+    """
+    Render and save the plots of several land use and elevation classes.
+
+    This function is defined at module level, so it can be pickled and run in
+    a worker process by `plot_lai_by_landuse_and_elevation`.
+
+    Parameters:
+        plot_tasks (List[tuple]): Plots to render. Each task is a tuple of:
+          - landuse_class (int): The land use class of the plotted data.
+          - elevation_class (str): The elevation class of the plotted data.
+          - group_data (pd.DataFrame): LAI data of the land use and elevation
+            class with the columns 'Year', 'DOY' and `display_data`.
+          - display_data (str): Column name to be displayed in the plot.
+          - results_folder_png_path (Path): Existing folder where the PNG plot
+            file will be saved.
+        dpi (int, optional): Resolution of the plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
+
+    Returns:
+        None
+
+    Notes:
+        - A single figure with an Agg canvas is created and cleared between
+          the plots, which avoids the overhead of creating a pyplot figure
+          for every plot.
+    """
+    # Create the figure once and reuse it for all plots
+    figure = Figure(figsize=(10, 6), dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+
+    with _background_png_writer() as save_png:
+        for (
+            landuse_class,
+            elevation_class,
+            group_data,
+            display_data,
+            results_folder_png_path,
+        ) in plot_tasks:
+            axes.clear()
+
+            # Reshape the data to one column per year
+            wide_data = group_data.pivot_table(
+                index="DOY",
+                columns="Year",
+                values=display_data,
+                aggfunc="mean",
+                observed=True,
+            )
+
+            # Fill days missing in some years linearly, so their lines are
+            # drawn straight through them instead of being interrupted
+            wide_data = wide_data.interpolate(
+                method="index", limit_area="inside"
+            )
+
+            # Plot LAI for all years at once
+            lines = axes.plot(wide_data.index.to_numpy(), wide_data.to_numpy())
 
-        # Save the plot as a PNG file
-        plt.savefig(plot_file_path)
-        plt.close()
+            # Set plot titles and labels
+            axes.set_title(
+                f"LAI for Landuse {landuse_class} and "
+                f"Elevation {elevation_class} ({display_data})"
+            )
+            axes.set_xlabel("Day of Year")
+            axes.set_ylabel("LAI")
+            axes.legend(lines, [f"Year {year}" for year in wide_data.columns])
+
+            # Define the path for saving the plot
+            plot_file_path = (
+                results_folder_png_path / f"lai_plot_landuse_{landuse_class}_"
+                f"elevation_{elevation_class}.png"
+            )
+
+            # Write the plot to a PNG file in the background
+            save_png(figure, plot_file_path)
 
 
 def plot_lai_by_landuse_and_elevation_for_year(
@@ -102,6 +423,8 @@ def plot_lai_by_landuse_and_elevation_for_year(
     display_datas: List[str] | None = None,
     year: int | None = None,
     results_folder_png: str = DEFAULT_PLOT_OUTPUT_DIR,
+    max_workers: int | None = None,
+    dpi: int = DEFAULT_PLOT_DPI,
 ) -> None:
     """
     Generates and saves plots of Leaf Area Index (LAI) data by land use and
@@ -123,6 +446,11 @@ def plot_lai_by_landuse_and_elevation_for_year(
         year (int): The year for which the data should be plotted.
         results_folder_png (str): The path to the folder where the PNG plot
           files will be saved. Defaults to 'results/png'.
+        max_workers (int, optional): Number of worker processes used to
+          render the PNG plots. Defaults to None, which means the number of
+          CPUs. With 1 the plots are rendered in the current process.
+        dpi (int, optional): Resolution of the PNG plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
 
     Returns:
         None
@@ -132,56 +460,120 @@ def plot_lai_by_landuse_and_elevation_for_year(
           and elevation class, showing only the data for the specified year.
         - The resulting plots are saved as PNG files in the specified folder,
           with filenames indicating the land use, elevation classes, and year.
+        - The PNG plots are rendered in parallel in a process pool, see
+          `plot_lai_by_landuse_and_elevation`.
     """
     if display_datas is None:
         display_datas = ["Q1", "Q3"]
 
-    # Filter the DataFrame for the specified year
-    year_data = data_frame[data_frame["Date"].dt.year == year]
+    # Filter the DataFrame for the specified year and calculate the year and
+    # the day of the year only for its rows
+    year_data = add_date_columns(_select_year(data_frame, year))
 
     # Ensure the results folder exists
     results_folder_png_path = ensure_directory_exists(results_folder_png)
 
     # Iterate over each combination of land use and elevation class
+    plot_tasks = []
     for (landuse_class, elevation_class), group_data in year_data.groupby(
-        ["Landuse", "Elevation_class"]
+        ["Landuse", "Elevation_class"], sort=False, observed=True
     ):
-        plt.figure(figsize=(10, 6))
-
-        # Plot the specified statistical measures
-        for display_data in display_datas:
-            plt.plot(
-                group_data["Date"].dt.dayofyear,
-                group_data[display_data],
-                label=display_data,
-            )
-
-        # Set plot titles and labels
-        plt.title(
-            f"LAI for Landuse {landuse_class} and "
-            f"Elevation {elevation_class} ({year})"
-        )
-        plt.xlabel("Day of Year")
-        plt.ylabel("Value")
-        plt.legend()
-
         # Define the path for saving the plot
         plot_file_path = (
             results_folder_png_path / f"lai_plot_landuse_{landuse_class}_"
             f"elevation_{elevation_class}_{year}.png"
         )
 
-        # Save the plot as a PNG file
-        plt.savefig(plot_file_path)
-        plt.close()
+        # Collect the data of the plot, keeping only the plotted columns
+        plot_tasks.append(
+            (
+                landuse_class,
+                elevation_class,
+                group_data[["DOY", *display_datas]],
+                display_datas,
+                year,
+                plot_file_path,
+            )
+        )
+
+    # Render the plots, in parallel if more than one worker is available
+    _render_in_parallel(
+        partial(_render_lai_year_plots, dpi=dpi), plot_tasks, max_workers
+    )
+
+
+def _render_lai_year_plots(
+    plot_tasks: List[tuple],
+    dpi: int = DEFAULT_PLOT_DPI,
+) -> None:
+    """
+    Render and save the plots of `plot_lai_by_landuse_and_elevation_for_year`.
+
+    This function is defined at module level, so it can be pickled and run in
+    a worker process.
+
+    Parameters:
+        plot_tasks (List[tuple]): Plots to render. Each task is a tuple of:
+          - landuse_class (int): The land use class of the plotted data.
+          - elevation_class (str): The elevation class of the plotted data.
+          - group_data (pd.DataFrame): LAI data of the land use and elevation
+            class with the columns 'DOY' and `display_datas`.
+          - display_datas (List[str]): Column names to be plotted.
+          - year (int): The plotted year.
+          - plot_file_path (Path): Path of the PNG file to save.
+        dpi (int, optional): Resolution of the plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
+
+    Returns:
+        None
+    """
+    # Create the figure once and reuse it for all plots
+    figure = Figure(figsize=(10, 6), dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+
+    with _background_png_writer() as save_png:
+        for (
+            landuse_class,
+            elevation_class,
+            group_data,
+            display_datas,
+            year,
+            plot_file_path,
+        ) in plot_tasks:
+            axes.clear()
+
+            # Plot the specified statistical measures against the day of year
+            day_of_year = group_data["DOY"].to_numpy()
+            lines = [
+                axes.plot(
+                    day_of_year,
+                    group_data[display_data].to_numpy(),
+                    label=display_data,
+                )[0]
+                for display_data in display_datas
+            ]
+
+            # Set plot titles and labels
+            axes.set_title(
+                f"LAI for Landuse {landuse_class} and "
+                f"Elevation {elevation_class} ({year})"
+            )
+            axes.set_xlabel("Day of Year")
+            axes.set_ylabel("Value")
+            axes.legend(handles=lines)
+
+            # Write the plot to a PNG file in the background
+            save_png(figure, plot_file_path)
 
 
-# @measure_time
 def plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
     data_frame: pd.DataFrame,
     year: int | None = None,
     display_datas: List[str] = DEFAULT_DISPLAY_DATAS,
     results_folder_png: str = DEFAULT_PLOT_OUTPUT_DIR,
+    max_workers: int | None = None,
+    dpi: int = DEFAULT_PLOT_DPI,
 ) -> None:
     """
     Generates and saves plots of Leaf Area Index (LAI) data by land use and
@@ -201,6 +593,11 @@ def plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
         year (int): The year for which the data should be plotted.
         results_folder_png (str): The path to the folder where the PNG plot
           files will be saved. Defaults to 'results/png'.
+        max_workers (int, optional): Number of worker processes used to
+          render the plots. Defaults to None, which means the number of CPUs.
+          With 1 the plots are rendered in the current process.
+        dpi (int, optional): Resolution of the PNG plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
 
     Returns:
         None
@@ -210,49 +607,104 @@ def plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
           and elevation class, showing only the data for the specified year.
         - The resulting plots are saved as PNG files in the specified folder,
           with filenames indicating the land use, elevation classes, and year.
+        - The plots are rendered in parallel in a process pool, see
+          `plot_lai_by_landuse_and_elevation`.
     """
-    # Filter the DataFrame for the specified year
-    year_data = data_frame[data_frame["Date"].dt.year == year]
+    # Filter the DataFrame for the specified year and calculate the year and
+    # the day of the year only for its rows
+    year_data = add_date_columns(_select_year(data_frame, year))
 
     # Ensure the results folder exists
     results_folder_png_path = ensure_directory_exists(results_folder_png)
 
-    # Iterate over each combination of land use and elevation class
-    for (landuse_class, elevation_class), group_data in year_data.groupby(
-        ["Landuse", "Elevation_class"]
-    ):
-        plt.figure(figsize=(10, 6))
-
-        # Use the new function to plot the graph
-        plot_single_lai_graph(
+    # Collect the data of each combination of land use and elevation class
+    plot_tasks = [
+        (
+            landuse_class,
+            elevation_class,
             group_data,
-            color_scheme=DEFAULT_COLOR_SCHEME["diagram1"],
+            year,
+            results_folder_png_path / f"lai_plot_landuse_{landuse_class}_"
+            f"elevation_{elevation_class}_{year}.png",
         )
-
-        # Set plot titles and labels
-        plt.title(
-            f"LAI for Landuse {landuse_class} and "
-            f"Elevation {elevation_class} ({year})"
+        for (landuse_class, elevation_class), group_data in year_data.groupby(
+            ["Landuse", "Elevation_class"], sort=False, observed=True
         )
-        plt.xlabel("Day of Year")
-        plt.ylabel("Value")
-        plt.legend()
+    ]
 
-        # Define the path for saving the plot
-        plot_file_path = (
-            results_folder_png_path / f"lai_plot_landuse_{landuse_class}_"
-            f"elevation_{elevation_class}_{year}.png"
-        )
+    # Render the plots, in parallel if more than one worker is available
+    _render_in_parallel(
+        partial(_render_lai_boxplot_year_plots, dpi=dpi),
+        plot_tasks,
+        max_workers,
+    )
+
+
+def _render_lai_boxplot_year_plots(
+    plot_tasks: List[tuple],
+    dpi: int = DEFAULT_PLOT_DPI,
+) -> None:
+    """
+    Render and save the plots of
+    `plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max`.
+
+    This function is defined at module level, so it can be pickled and run in
+    a worker process.
+
+    Parameters:
+        plot_tasks (List[tuple]): Plots to render. Each task is a tuple of:
+          - landuse_class (int): The land use class of the plotted data.
+          - elevation_class (str): The elevation class of the plotted data.
+          - group_data (pd.DataFrame): LAI data of the land use and elevation
+            class.
+          - year (int): The plotted year.
+          - plot_file_path (Path): Path of the PNG file to save.
+        dpi (int, optional): Resolution of the plots. Defaults to
+          `DEFAULT_PLOT_DPI`.
+
+    Returns:
+        None
+    """
+    # Create the figure once and reuse it for all plots
+    figure = Figure(figsize=(10, 6), dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+
+    with _background_png_writer() as save_png:
+        for (
+            landuse_class,
+            elevation_class,
+            group_data,
+            year,
+            plot_file_path,
+        ) in plot_tasks:
+            axes.clear()
+
+            # Use the new function to plot the graph
+            handles = plot_single_lai_graph(
+                group_data,
+                color_scheme=DEFAULT_COLOR_SCHEME["diagram1"],
+                axes=axes,
+            )
+
+            # Set plot titles and labels
+            axes.set_title(
+                f"LAI for Landuse {landuse_class} and "
+                f"Elevation {elevation_class} ({year})"
+            )
+            axes.set_xlabel("Day of Year")
+            axes.set_ylabel("Value")
+            axes.legend(handles=handles)
 
-        # Save the plot as a PNG file
-        plt.savefig(plot_file_path)
-        plt.close()
+            # Write the plot to a PNG file in the background
+            save_png(figure, plot_file_path)
 
 
 def plot_comparison_of_two_lai_datasets(
     data_frame_first_path: str,
     data_frame_second_path: str,
     results_folder_png: str = DEFAULT_PLOT_COMPARE_OUTPUT_DIR,
+    dpi: int = DEFAULT_PLOT_DPI,
     ) -> None:
     """
     Plot a comparison of two LAI (Leaf Area Index) datasets and save the 
@@ -270,6 +722,8 @@ def plot_comparison_of_two_lai_datasets(
             LAI data.
         results_folder_png (str, optional): Directory path where the resulting 
             PNG plot will be saved. Defaults to DEFAULT_PLOT_COMPARE_OUTPUT_DIR
+        dpi (int, optional): Resolution of the PNG plot. Defaults to
+            DEFAULT_PLOT_DPI.
 
     Returns:
         None: This function does not return any value, but it saves a PNG file
@@ -278,9 +732,13 @@ def plot_comparison_of_two_lai_datasets(
     # Ensure the results folder exists or create it if it doesn't
     results_folder_png_path = ensure_directory_exists(results_folder_png)
 
-    # Read the two CSV files into DataFrames
-    data_frame_first = pd.read_csv(data_frame_first_path)
-    data_frame_second = pd.read_csv(data_frame_second_path)
+    # Read the two CSV files into DataFrames concurrently (the readers
+    # release the GIL while parsing)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        data_frame_first, data_frame_second = executor.map(
+            _read_comparison_csv,
+            [data_frame_first_path, data_frame_second_path],
+        )
 
     # Extract land use class and elevation from the filename for the dataset
     landuse_cls_1, elevation_cls_1 = extract_data_from_csv_filename(
@@ -293,24 +751,28 @@ def plot_comparison_of_two_lai_datasets(
         )
 
     # Set up the figure size for the plot
-    plt.figure(figsize=(10, 6))
+    figure = Figure(figsize=(10, 6), dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
 
     # Plot the first dataset using the defined color scheme
-    plot_single_lai_graph(
+    handles = plot_single_lai_graph(
         data_frame_first,
         color_scheme=DEFAULT_COLOR_SCHEME["diagram1"],
         label_prefix=landuse_cls_1,
+        axes=axes,
     )
 
     # Plot the second dataset using the defined color scheme
-    plot_single_lai_graph(
+    handles += plot_single_lai_graph(
         data_frame_second,
         color_scheme=DEFAULT_COLOR_SCHEME["diagram2"],
         label_prefix=landuse_cls_2,
+        axes=axes,
     )
 
     # Set the plot title, using the extracted land use and elevation classes
-    plt.title(
+    axes.set_title(
         f"Comparison of LAI Statistical Values between Land Use Classes\
  {landuse_cls_1} and {landuse_cls_2} in the Elevation Range\
  of {elevation_cls_1} m"
@@ -319,11 +781,11 @@ def plot_comparison_of_two_lai_datasets(
     
 
     # Set labels for the x and y axes
-    plt.xlabel("Day of Year")
-    plt.ylabel("LAI Value")
+    axes.set_xlabel("Day of Year")
+    axes.set_ylabel("LAI Value")
 
     # Add a legend to differentiate between the two datasets
-    plt.legend()
+    axes.legend(handles=handles)
 
     # Define the path for saving the comparison plot
     plot_file_path = (
@@ -331,9 +793,33 @@ def plot_comparison_of_two_lai_datasets(
         f"elevation_{elevation_cls_1}.png"
     )
 
-    # Save the plot as a PNG file and close the plot to free up memory
-    plt.savefig(plot_file_path)
-    plt.close()
+    # Save the plot as a PNG file
+    figure.savefig(plot_file_path, pil_kwargs=DEFAULT_PNG_PIL_KWARGS)
+
+
+def _read_comparison_csv(csv_file_path: str) -> pd.DataFrame:
+    """
+    Read the columns of an LAI CSV file that are needed for a comparison
+    plot.
+
+    Parameters:
+        csv_file_path (str): Path to the CSV file containing LAI data.
+
+    Returns:
+        pd.DataFrame: The 'Date' column (parsed as dates) and the columns of
+          DEFAULT_DISPLAY_DATAS (as float32, like the LAI statistics of
+          `create_lai_data_frame`).
+
+    Notes:
+        - If pyarrow is installed, its multithreaded CSV reader is used.
+    """
+    return pd.read_csv(
+        csv_file_path,
+        engine=CSV_READ_ENGINE,
+        usecols=COMPARE_COLUMNS,
+        parse_dates=["Date"],
+        dtype={column: np.float32 for column in DEFAULT_DISPLAY_DATAS},
+    )
 
 
 def plot_single_lai_graph(
@@ -341,7 +827,8 @@ def plot_single_lai_graph(
     color_scheme: dict,
     label_prefix: str = None,
     display_datas: List[str] = DEFAULT_DISPLAY_DATAS,
-    ) -> None:
+    axes: Axes | None = None,
+    ) -> list:
     """
     Plot LAI (Leaf Area Index) data for a specific time period with various 
     statistical measures such as Q1, Q3, Min, Max, and Median.
@@ -359,57 +846,74 @@ def plot_single_lai_graph(
         display_datas (List[str], optional): A list of statistical measures 
           (e.g., 'Q1', 'Q3', 'Min', 'Max', 'Median') to display on the plot. 
           Defaults to DEFAULT_DISPLAY_DATAS.
+        axes (matplotlib.axes.Axes, optional): The axes to draw on. Defaults
+          to None, which means the current pyplot axes.
 
     Returns:
-        None: The function generates the plot but does not return any value.
+        list: The drawn artists in the order they were drawn, which can be
+          passed to `axes.legend(handles=...)` so that matplotlib does not
+          have to search the axes for them.
+
+    Notes:
+        - `group_data` is not modified.
     """
-    # Convert 'Date' column to datetime format if it is not already
-    group_data["Date"] = pd.to_datetime(group_data["Date"])
+    # Draw on the current pyplot axes unless the axes are given
+    if axes is None:
+        axes = plt.gca()
+
+    # Calculate the day of the year once for all plotted measures. Use the
+    # 'DOY' column if it was already added by `add_date_columns`, otherwise
+    # convert the 'Date' column (e.g. strings read from a CSV file)
+    if "DOY" in group_data.columns:
+        day_of_year = group_data["DOY"].to_numpy()
+    else:
+        day_of_year = (
+            pd.to_datetime(group_data["Date"]).dt.dayofyear.to_numpy()
+        )
+
+    # Extract the plotted columns as arrays once
+    values = {
+        column: group_data[column].to_numpy()
+        for column in set(display_datas) & set(group_data.columns)
+    }
+
+    # Collect the drawn artists for the legend
+    handles = []
 
     # Check if both 'Q1' and 'Q3' are in the display_datas list
     # If yes, plot the shaded area between Q1 and Q3
     if "Q1" in display_datas and "Q3" in display_datas:
 
-        plt.fill_between(
-            group_data["Date"].dt.dayofyear,
-            group_data["Q1"],
-            group_data["Q3"],
+        shaded_area = axes.fill_between(
+            day_of_year,
+            values["Q1"],
+            values["Q3"],
             color=color_scheme["color_q1_q3"],
             alpha=0.5,
             label=f"{label_prefix} Q1 - Q3",
         )
+        handles.append(shaded_area)
+
+    # Resolve the line style of each measure with the colors of the scheme
+    styles = {
+        measure: {**style, "color": color_scheme[style["color"]]}
+        for measure, style in DEFAULT_MEASURE_STYLES.items()
+    }
+
+    # Plot every measure except Q1 and Q3 as a line with its style (measures
+    # without a style use the default line style)
+    line_measures = [
+        display_data
+        for display_data in display_datas
+        if display_data not in SHADED_MEASURES
+    ]
+    for display_data in line_measures:
+        handles += axes.plot(
+            day_of_year,
+            values[display_data],
+            label=f"{label_prefix} {display_data}",
+            **styles.get(display_data, {}),
+        )
 
-    # Iterate through each specified statistical measure in display_datas
-    for display_data in display_datas:
-
-        # If the current measure is 'Min' or 'Max', plot it with specific style
-        if display_data == "Min" or display_data == "Max":
-
-            plt.plot(
-                group_data["Date"].dt.dayofyear,
-                group_data[display_data],
-                color=color_scheme["color_min_max"],
-                linestyle="-",
-                linewidth=0.5,
-                label=f"{label_prefix} {display_data}",
-            )
-
-        # If the current measure is 'Median', plot it with specific styling
-        elif display_data == "Median":
-            plt.plot(
-                group_data["Date"].dt.dayofyear,
-                group_data[display_data],
-                color=color_scheme["color_median"],
-                linestyle="-",
-                linewidth=2,
-                label=f"{label_prefix} {display_data}",
-            )
-
-        # For any other measure (other than Q1, Q3), plot it as is
-        elif display_data not in ["Q1", "Q3"]:
-            plt.plot(
-                group_data["Date"].dt.dayofyear,
-                group_data[display_data],
-                label=f"{label_prefix} {display_data}",
-            )
+    return handles
 
@@ -1,5 +1,9 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import os
 from pathlib import Path
+from typing import List
 
 import geopandas as gpd
 import numpy as np
@@ -13,6 +17,23 @@ TEMP_LAI_DIR = "temp\\temp_lai_processing"
 DEFAULT_HDR_DRIVER = "ENVI"
 DEFAULT_TEMP_RASTER_NAME = "template_raster.tif"
 DEFAULT_TEMP_DIR = "temp"
+DEFAULT_RASTER_CACHE_SIZE = 4
+DEFAULT_TEMP_TIFF_OPTIONS = {
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    # Switch to BigTIFF when an uncompressed file could exceed 4 GB
+    "BIGTIFF": "IF_SAFER",
+}
+# Result rasters are kept, so they are compressed with the fast Zstandard
+# level and the floating-point predictor, using all CPUs
+DEFAULT_RESULT_TIFF_OPTIONS = {
+    **DEFAULT_TEMP_TIFF_OPTIONS,
+    "compress": "zstd",
+    "zstd_level": 1,
+    "predictor": 3,
+    "num_threads": "ALL_CPUS",
+}
 
 
 def convert_hdr_to_tif(
@@ -45,21 +66,25 @@ def convert_hdr_to_tif(
     # Ensure the directory exists
     temp_lai_folder_path = ensure_directory_exists(temp_lai_folder_path)
 
-    # Read data from HDR file
+    # Read data from HDR file directly as float32, so that integer data can
+    # hold NaN and float64 data are not copied once more when written
     with rasterio.open(data_file_path, "r", driver=driver) as src:
-        data = src.read(1)
+        data = src.read(1, out_dtype=np.float32)
         profile = src.profile
 
-        # Replace values less than 0 with NaN
-        data[data < 0] = np.nan
+    # Replace values less than 0 with NaN (in place)
+    np.putmask(data, data < 0, np.nan)
 
-    # Update profile for saving in GTiff format
+    # Update profile for saving in GTiff format. The file is a temporary
+    # intermediate that is read again later, so it is written uncompressed
+    # and tiled to avoid decompression on every read
+    profile.pop("compress", None)
     profile.update(
                     driver="GTiff",
                     dtype=rasterio.float32,
                     count=1,
                     nodata=np.nan,
-                    compress="lzw"
+                    **DEFAULT_TEMP_TIFF_OPTIONS
                 )
 
     # Formulate path to tif file based on HDR file name in the temporary
@@ -69,11 +94,65 @@ def convert_hdr_to_tif(
 
     # Save data in TIFF format
     with rasterio.open(out_tif_file, "w", **profile) as dst:
-        dst.write(data.astype(rasterio.float32), 1)
+        dst.write(data, 1)
 
     return out_tif_file
 
 
+def convert_hdr_files_to_tif(
+    data_file_paths: List[Path],
+    temp_lai_folder_path: str = TEMP_LAI_DIR,
+    max_workers: int | None = None,
+    ) -> List[Path]:
+    """
+    Convert several HDR format raster files to TIFF format in parallel.
+
+    Every file is converted independently by `convert_hdr_to_tif`, so the
+    conversions are distributed over a pool of worker processes.
+
+    Parameters:
+       data_file_paths (List[Path]): Paths to the HDR format raster files.
+       temp_lai_folder_path (str, optional): Path to the temporary folder where
+                the TIFF files will be saved.
+                Defaults to 'temp\\temp_lai_processing'.
+       max_workers (int, optional): Number of worker processes. Defaults to
+                None, which means the number of CPUs. With 1 the files are
+                converted in the current process.
+
+    Returns:
+       List[Path]: Full paths to the converted TIF files, in the order of
+                `data_file_paths`.
+
+    Notes:
+        - On Windows the calling script must be guarded with
+          `if __name__ == "__main__":`, since the worker processes import it.
+    """
+    if not data_file_paths:
+        return []
+
+    # Create the folder once, before the workers write into it
+    ensure_directory_exists(temp_lai_folder_path)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(data_file_paths))
+
+    if max_workers == 1:
+        return [
+            convert_hdr_to_tif(data_file_path, temp_lai_folder_path)
+            for data_file_path in data_file_paths
+        ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                convert_hdr_to_tif,
+                data_file_paths,
+                [temp_lai_folder_path] * len(data_file_paths),
+            )
+        )
+
+
 def cut_land_use_file_path(
     file_path: str,
     aoi_path: str,
@@ -159,6 +238,8 @@ def create_template_raster(
           GTiff format, and creates a new raster file filled with zeros.
         - The output raster file will have the same dimensions and coordinate
           system as the base raster, but all pixel values will be set to 0.
+        - The zeros are written block by block, so memory use does not grow
+          with the size of the raster.
     """
     # Define the Path object for the output folder
     output_folder_path = ensure_directory_exists(output_folder)
@@ -173,21 +254,34 @@ def create_template_raster(
         # Remove nodata parameter if it exists (not needed for an empty file)
         profile.pop("nodata", None)
 
-        # Update profile for saving in GTiff format
+        # Do not inherit the compression of the base raster
+        profile.pop("compress", None)
+
+        # Update profile for saving in GTiff format (uncompressed and tiled,
+        # since the template is only a temporary file)
         profile.update(
                       driver="GTiff",
                       dtype=rasterio.float32,
                       count=1,
-                      compress="lzw"
+                      **DEFAULT_TEMP_TIFF_OPTIONS
                       )
 
         # Create a new TIFF file with all pixels set to 0
         with rasterio.open(template_raster_path, "w", **profile) as dst:
-            # Create an array filled with zeros
-            zeros_array = np.zeros((src.height, src.width), dtype=np.float32)
-
-            # Write the zeros array to the output file
-            dst.write(zeros_array, 1)
+            # Create a single block filled with zeros
+            block_height, block_width = dst.block_shapes[0]
+            zeros_block = np.zeros(
+                (block_height, block_width), dtype=np.float32
+            )
+
+            # Write the zeros block by block (blocks at the right and bottom
+            # edges may be smaller), so the whole raster is never in memory
+            for _, window in dst.block_windows(1):
+                dst.write(
+                    zeros_block[:window.height, :window.width],
+                    1,
+                    window=window,
+                )
     return template_raster_path
 
 
@@ -199,10 +293,89 @@ def read_raster(raster_path: Path) -> np.ndarray:
         raster_path (Path): The path to the raster file to be read.
 
     Returns:
-        numpy.ndarray: The first band of the raster file as a 2D array.
+        numpy.ndarray: The first band of the raster file as a 2D float32
+          array.
+
+    Notes:
+        - The band is always read as float32, regardless of the dtype stored
+          in the file, so that all downstream reductions run in float32.
+    """
+    with rasterio.open(raster_path) as src:
+        return src.read(1, out_dtype="float32")
+
+
+@lru_cache(maxsize=DEFAULT_RASTER_CACHE_SIZE)
+def _cached_read_raster(
+    raster_path: str, modification_time: float
+) -> np.ndarray:
+    """
+    Call `read_raster` and memoize its result as a read-only array.
+
+    The `modification_time` is part of the cache key, so a changed file is
+    read again.
+    """
+    data = read_raster(Path(raster_path))
+    data.flags.writeable = False
+    return data
+
+
+def read_raster_cached(raster_path: Path) -> np.ndarray:
+    """
+    Reads the first band of a raster file, reusing the result of a previous
+    call for the same unchanged file.
+
+    Static inputs such as the land use raster are the same for every run in
+    a Python session, so they only need to be read and decoded once.
+
+    Parameters:
+        raster_path (Path): The path to the raster file to be read.
+
+    Returns:
+        numpy.ndarray: The first band of the raster file as a read-only 2D
+          float32 array. Use `read_raster` to get an array that may be
+          modified.
+
+    Notes:
+        - The cache is keyed by the resolved path and the modification time
+          of the file and keeps at most `DEFAULT_RASTER_CACHE_SIZE` rasters.
+    """
+    raster_path = Path(raster_path).resolve()
+    return _cached_read_raster(
+        str(raster_path), os.path.getmtime(raster_path)
+    )
+
+
+@lru_cache(maxsize=DEFAULT_RASTER_CACHE_SIZE)
+def _cached_raster_meta(raster_path: str, modification_time: float) -> dict:
+    """
+    Read and memoize the metadata of a raster file.
+
+    The `modification_time` is part of the cache key, so a changed file is
+    read again. The returned dict is shared and must not be modified.
     """
     with rasterio.open(raster_path) as src:
-        return src.read(1)
+        return src.meta
+
+
+def read_raster_meta_cached(raster_path: Path) -> dict:
+    """
+    Read the metadata of a raster file, reusing the result of a previous call
+    for the same unchanged file.
+
+    Parameters:
+        raster_path (Path): The path to the raster file.
+
+    Returns:
+        dict: A copy of the metadata (`meta`) of the raster file, which may
+          be modified.
+
+    Notes:
+        - The cache is keyed like the one of `read_raster_cached`.
+    """
+    raster_path = Path(raster_path).resolve()
+    return _cached_raster_meta(
+        str(raster_path), os.path.getmtime(raster_path)
+    ).copy()
 
 
 def save_lai_to_raster(
@@ -226,20 +399,25 @@ def save_lai_to_raster(
 
     Returns:
         None: The function saves the LAI data as a new raster file.
+
+    Notes:
+        - The file is written with `DEFAULT_RESULT_TIFF_OPTIONS` (Zstandard
+          compression with the floating-point predictor), which requires
+          GDAL 2.3 or newer.
     """
-    # Open the reference raster to retrieve metadata
-    with rasterio.open(reference_raster_path) as ref_raster:
-        # Copy metadata from the reference raster
-        meta = ref_raster.meta.copy()
-        
-        # Update metadata to match the data type of lai_adjusted (float32)
-        meta.update(dtype='float32', count=1)
-        
-        # Check if the dimensions of lai_adjusted match the reference raster
-        if lai_adjusted.shape != (meta['height'], meta['width']):
-            raise ValueError("The dimensions of lai_adjusted do not match the \
+    # Copy metadata from the reference raster (the reference raster is only
+    # opened on the first call for every file)
+    meta = read_raster_meta_cached(reference_raster_path)
+
+    # Update metadata to match the data type of lai_adjusted (float32) and
+    # compress the file
+    meta.update(dtype='float32', count=1, **DEFAULT_RESULT_TIFF_OPTIONS)
+
+    # Check if the dimensions of lai_adjusted match the reference raster
+    if lai_adjusted.shape != (meta['height'], meta['width']):
+        raise ValueError("The dimensions of lai_adjusted do not match the \
 reference raster dimensions.")
-        
-        # Write the adjusted LAI data to the new raster file
-        with rasterio.open(output_path, 'w', **meta) as dst:
-            dst.write(lai_adjusted.astype('float32'), 1)
+
+    # Write the adjusted LAI data to the new raster file
+    with rasterio.open(output_path, 'w', **meta) as dst:
+        dst.write(lai_adjusted.astype('float32'), 1)
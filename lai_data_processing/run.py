@@ -1,17 +1,6 @@
-import asyncio
+import argparse
 import time
-
-from main import (
-                  run_all_lai_analysis,
-                  run_calculate_and_save_mean_lai_by_day_of_year,
-                  run_calculate_and_save_mean_lai_by_period,
-                  run_plot_lai_by_landuse_and_elevation,
-                  run_plot_lai_by_landuse_and_elevation_for_year,
-                  run_plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max,
-                  run_lai_modification
-                  )
-from plotting import plot_comparison_of_two_lai_datasets
-
+from typing import List
 
 
 # Path to the folder with LAI data
@@ -61,165 +50,351 @@ outer_year = 2008
 
 is_should_remove_temp = False
 
-start_time = time.time()
-
 # TODO: change names
 df_1 = "D:\\CzechGlobe\\Task\\task_3_20240715_(Hidro_team_LAI_TimeSeries_Aggregation)\\results_done\\results_daily_csv\\lai_data_2008_311_700-800.csv"
 df_2 = "D:\\CzechGlobe\\Task\\task_3_20240715_(Hidro_team_LAI_TimeSeries_Aggregation)\\results_done\\results_daily_csv\\lai_data_2008_312_700-800.csv"
 
 
-
-"""
-Creates CSV files for each cluster (land use / elevation / year).
-Each file contains daily LAI statistical data for each day of the year.
-The data is saved at: results\results_daily_csv\lai_data_2008_311_700-800.csv.
-The filename includes the year of the data (2008), the land use class (311),
-and the elevation range (700-800).
-"""
-# run_calculate_and_save_mean_lai_by_period(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     is_clusters = outer_is_clusters,
-#     land_use_classes_of_interest=outer_land_use_classes_of_interest,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp,
-#     )
-
-
-"""
-Creates a single CSV file.
-The file contains daily LAI statistical data averaged over all the processed
-years. For example, a single day (01-03) will contain the average LAI values
-for this cluster over several years.
-The data is saved at: results\mean_characteristic_year.csv.
-"""
-# run_calculate_and_save_mean_lai_by_day_of_year(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     land_use_classes_of_interest=None,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp,
-# )
-
-
-"""
-Creates PNG files for each cluster (land use / elevation).
-The file contains a chart where each line represents the average LAI values for
-a specific year.
-The data is saved at: results\png.
-"""
-# run_plot_lai_by_landuse_and_elevation(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     land_use_classes_of_interest=None,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp,
-# )
-
-
-"""
-Creates PNG files for each cluster (land use / elevation).
-The file contains a chart for a specific year where each line represents
-different LAI statistical values (can be customized using the attribute
-outer_display_datas).
-The data is saved at: results\png.
-"""
-# run_plot_lai_by_landuse_and_elevation_for_year(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     display_datas=outer_display_datas,
-#     year=outer_year,
-#     land_use_classes_of_interest=None,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp
-# )
-
-
-"""
-This function runs the first three functions simultaneously.
-"""
-# run_all_lai_analysis(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     land_use_classes_of_interest=outer_land_use_classes_of_interest,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp
-# )
-
-
-
-"""
-Creates PNG files for each cluster (land use / elevation / year).
-The file contains a chart for a specific year showing the min, Q1, mean, Q3,
-and max LAI values.
-The data is saved at: results\png.
-"""
-# run_plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
-#     lai_folder_path=outer_lai_folder_path,
-#     land_use_path=outer_land_use_path,
-#     dem_file_path=outer_dem_file_path,
-#     elevation_bins=outer_elevation_bins,
-#     year=outer_year,
-#     land_use_classes_of_interest=outer_land_use_classes_of_interest,
-#     aoi_boundary_file=outer_aoi_boundary_file,
-#     should_remove_temp=is_should_remove_temp
-# )
-
-
-"""
-Creates PNG files comparing two data sets. The file contains a diagram for two
-data sets being compared, specifically: the median, minimum, Q1, Q3, and
-maximum LAI values for each of the specified classes. Data is saved in:
-results\png_compare.
-
-For input data, the files should be taken from the folder
-results_done\results_daily_csv\. These files can be obtained by using the
-function run_calculate_and_save_mean_lai_by_period with the attribute
-is_clusters = True.
-"""
-# plot_comparison_of_two_lai_datasets(
-#     data_frame_first_path = df_1,
-#     data_frame_second_path = df_2,
-# )
-
-
-"""
-Creates modified TIFF files for each LAI image. When using the function, you
-need to specify current_landuse_class — the class you want to modify, and
-target_landuse_class — the class to which you want to adjust the values of
-current_landuse_class. After processing, the data will be saved in the folder
-results\modify_lai.
-
-Method A
-"""
-run_lai_modification(
-    lai_folder_path=outer_lai_folder_path,
-    land_use_path=outer_land_use_path,
-    dem_file_path=outer_dem_file_path,
-    elevation_bins=outer_elevation_bins,
-    current_landuse_class=outer_current_landuse_class,
-    target_landuse_class=outer_target_landuse_class,
-    aoi_boundary_file=outer_aoi_boundary_file,
-    should_remove_temp=is_should_remove_temp
-    )
-
-
-
-
-
-
-end_time = time.time()
-execution_time = end_time - start_time
-print(f"Execution time of {execution_time:.4f} seconds")
-
-
+TASKS = (
+    "period",
+    "day_of_year",
+    "plot",
+    "plot_for_year",
+    "plot_for_year_with_q1_q3_med_min_max",
+    "all",
+    "tasks",
+    "compare",
+    "modification",
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    The values defined above are used as defaults, so the script can still
+    be configured by editing them and run without any arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Process LAI data and create CSV files, plots or modified LAI "
+            "rasters."
+        )
+    )
+    parser.add_argument(
+        "task",
+        nargs="?",
+        choices=TASKS,
+        default="modification",
+        help="The task to run (default: modification).",
+    )
+    parser.add_argument(
+        "--lai-folder",
+        default=outer_lai_folder_path,
+        help="Path to the folder with LAI data.",
+    )
+    parser.add_argument(
+        "--land-use",
+        default=outer_land_use_path,
+        help="Path to the land use file.",
+    )
+    parser.add_argument(
+        "--dem",
+        default=outer_dem_file_path,
+        help="Path to the digital elevation model file.",
+    )
+    aoi_group = parser.add_mutually_exclusive_group()
+    aoi_group.add_argument(
+        "--aoi",
+        default=outer_aoi_boundary_file,
+        help="Path to the boundary file of the area of interest.",
+    )
+    aoi_group.add_argument(
+        "--no-aoi",
+        dest="aoi",
+        action="store_const",
+        const=None,
+        help="Analyze the entire area instead of the area of interest.",
+    )
+    parser.add_argument(
+        "--elevation-bins",
+        nargs="+",
+        type=int,
+        default=outer_elevation_bins,
+        metavar="ELEVATION",
+        help="Boundaries of the elevation classes.",
+    )
+    land_use_group = parser.add_mutually_exclusive_group()
+    land_use_group.add_argument(
+        "--land-use-classes",
+        nargs="+",
+        type=int,
+        metavar="CLASS",
+        help=(
+            "Land use classes to include in the analysis (default: the "
+            "classes configured for the task)."
+        ),
+    )
+    land_use_group.add_argument(
+        "--all-land-use-classes",
+        action="store_true",
+        help="Include all land use classes in the analysis.",
+    )
+    parser.add_argument(
+        "--display-datas",
+        nargs="+",
+        default=outer_display_datas,
+        metavar="COLUMN",
+        help="LAI statistics shown in the per-year plots.",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=outer_year,
+        help="The year of the per-year plots.",
+    )
+    parser.add_argument(
+        "--analysis-tasks",
+        nargs="+",
+        default=["clusters_csv", "plot_for_year"],
+        help='Analysis tasks run by the "tasks" task.',
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        default=[df_1, df_2],
+        metavar=("FIRST_CSV", "SECOND_CSV"),
+        help='The two CSV files compared by the "compare" task.',
+    )
+    parser.add_argument(
+        "--current-class",
+        type=int,
+        default=outer_current_landuse_class,
+        help='The land use class modified by the "modification" task.',
+    )
+    parser.add_argument(
+        "--target-class",
+        type=int,
+        default=outer_target_landuse_class,
+        help=(
+            'The land use class whose values the "modification" task '
+            "applies to the current class."
+        ),
+    )
+    parser.add_argument(
+        "--clusters",
+        action=argparse.BooleanOptionalAction,
+        default=outer_is_clusters,
+        help='Save a CSV file for every cluster in the "period" task.',
+    )
+    parser.add_argument(
+        "--remove-temp",
+        action=argparse.BooleanOptionalAction,
+        default=is_should_remove_temp,
+        help="Remove the temporary files after processing.",
+    )
+    return parser.parse_args()
+
+
+def select_land_use_classes(
+    arguments: argparse.Namespace,
+    task_default: List[int] | None,
+) -> List[int] | None:
+    """
+    Select the land use classes of interest of a task.
+
+    Parameters:
+        arguments (argparse.Namespace): The parsed command line arguments.
+        task_default (list of int or None): The classes used by the task if
+          none are given on the command line. None means all classes.
+
+    Returns:
+        list of int or None: The land use classes to include in the
+          analysis, or None to include all classes.
+    """
+    if arguments.all_land_use_classes:
+        return None
+    if arguments.land_use_classes is not None:
+        return arguments.land_use_classes
+    return task_default
+
+
+def run_task(arguments: argparse.Namespace) -> None:
+    """
+    Run the selected task.
+
+    The functions of the task are imported only here, so that the heavy
+    processing modules are not imported before the arguments are parsed
+    and the comparison of two CSV files does not import rasterio and
+    geopandas at all.
+
+    Parameters:
+        arguments (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        None
+    """
+    input_data = {
+        "lai_folder_path": arguments.lai_folder,
+        "land_use_path": arguments.land_use,
+        "dem_file_path": arguments.dem,
+        "elevation_bins": arguments.elevation_bins,
+        "aoi_boundary_file": arguments.aoi,
+        "should_remove_temp": arguments.remove_temp,
+    }
+
+    if arguments.task == "period":
+        # Creates CSV files for each cluster (land use / elevation / year).
+        # Each file contains daily LAI statistical data for each day of the
+        # year. The data is saved at:
+        # results\results_daily_csv\lai_data_2008_311_700-800.csv.
+        # The filename includes the year of the data (2008), the land use
+        # class (311), and the elevation range (700-800).
+        from main import run_calculate_and_save_mean_lai_by_period
+
+        run_calculate_and_save_mean_lai_by_period(
+            is_clusters=arguments.clusters,
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, outer_land_use_classes_of_interest
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "day_of_year":
+        # Creates a single CSV file. The file contains daily LAI statistical
+        # data averaged over all the processed years. For example, a single
+        # day (01-03) will contain the average LAI values for this cluster
+        # over several years.
+        # The data is saved at: results\mean_characteristic_year.csv.
+        from main import run_calculate_and_save_mean_lai_by_day_of_year
+
+        run_calculate_and_save_mean_lai_by_day_of_year(
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, None
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "plot":
+        # Creates PNG files for each cluster (land use / elevation). The file
+        # contains a chart where each line represents the average LAI values
+        # for a specific year.
+        # The data is saved at: results\png.
+        from main import run_plot_lai_by_landuse_and_elevation
+
+        run_plot_lai_by_landuse_and_elevation(
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, None
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "plot_for_year":
+        # Creates PNG files for each cluster (land use / elevation). The file
+        # contains a chart for a specific year where each line represents
+        # different LAI statistical values (can be customized using the
+        # option --display-datas).
+        # The data is saved at: results\png.
+        from main import run_plot_lai_by_landuse_and_elevation_for_year
+
+        run_plot_lai_by_landuse_and_elevation_for_year(
+            display_datas=arguments.display_datas,
+            year=arguments.year,
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, None
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "plot_for_year_with_q1_q3_med_min_max":
+        # Creates PNG files for each cluster (land use / elevation / year).
+        # The file contains a chart for a specific year showing the min, Q1,
+        # mean, Q3, and max LAI values.
+        # The data is saved at: results\png.
+        from main import (
+            run_plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max,
+        )
+
+        run_plot_lai_by_landuse_and_elevation_for_year_with_q1_q3_med_min_max(
+            year=arguments.year,
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, outer_land_use_classes_of_interest
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "all":
+        # Runs the first three tasks simultaneously.
+        from main import run_all_lai_analysis
+
+        run_all_lai_analysis(
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, outer_land_use_classes_of_interest
+            ),
+            **input_data,
+        )
+
+    elif arguments.task == "tasks":
+        # Runs any combination of the analysis tasks on data that are
+        # processed only once. Available tasks: "csv", "day_of_year_csv",
+        # "clusters_csv", "plot", "plot_for_year",
+        # "plot_for_year_with_q1_q3_med_min_max".
+        from main import run_lai_analysis_tasks
+
+        run_lai_analysis_tasks(
+            arguments.analysis_tasks,
+            land_use_classes_of_interest=select_land_use_classes(
+                arguments, outer_land_use_classes_of_interest
+            ),
+            year=arguments.year,
+            display_datas=arguments.display_datas,
+            **input_data,
+        )
+
+    elif arguments.task == "compare":
+        # Creates PNG files comparing two data sets. The file contains a
+        # diagram for two data sets being compared, specifically: the median,
+        # minimum, Q1, Q3, and maximum LAI values for each of the specified
+        # classes. Data is saved in: results\png_compare.
+        #
+        # For input data, the files should be taken from the folder
+        # results_done\results_daily_csv\. These files can be obtained by
+        # using the task "period" with the option --clusters.
+        from plotting import plot_comparison_of_two_lai_datasets
+
+        plot_comparison_of_two_lai_datasets(
+            data_frame_first_path=arguments.compare[0],
+            data_frame_second_path=arguments.compare[1],
+        )
+
+    elif arguments.task == "modification":
+        # Creates modified TIFF files for each LAI image. When using the
+        # function, you need to specify current_landuse_class — the class you
+        # want to modify, and target_landuse_class — the class to which you
+        # want to adjust the values of current_landuse_class. After
+        # processing, the data will be saved in the folder
+        # results\modify_lai.
+        #
+        # Method A
+        from main import run_lai_modification
+
+        run_lai_modification(
+            current_landuse_class=arguments.current_class,
+            target_landuse_class=arguments.target_class,
+            **input_data,
+        )
+
+
+# Plots are rendered in worker processes, which re-import this script on
+# Windows, so the processing must only run in the main process
+if __name__ == "__main__":
+    start_time = time.time()
+
+    run_task(parse_arguments())
+
+    end_time = time.time()
+    execution_time = end_time - start_time
+    print(f"Execution time of {execution_time:.4f} seconds")
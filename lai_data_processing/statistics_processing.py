@@ -1,24 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import List, Tuple
+
 import numpy as np
 
 
-def calculate_boxplot_stats(lai_data: np.ndarray) -> dict:
+# Percentiles of the quartiles (float32, so the results stay float32)
+QUARTILE_PERCENTILES = np.array([25, 50, 75], dtype=np.float32)
+# Percentiles of the minimum, the quartiles and the maximum
+BOXPLOT_PERCENTILES = np.array([0, 25, 50, 75, 100], dtype=np.float32)
+
+
+def calculate_boxplot_stats(
+    lai_data: np.ndarray,
+    axis: int | None = None,
+) -> dict:
     """
     Calculate boxplot statistics for given LAI data.
 
     Parameters:
         lai_data (numpy.ndarray): Array containing LAI values.
+        axis (int, optional): Axis along which the statistics are calculated.
+          Defaults to None, which means the statistics of the whole array.
 
     Returns:
-        dict: A dictionary containing boxplot statistics.
+        dict: A dictionary containing boxplot statistics. The values are
+          scalars if `axis` is None, otherwise arrays.
+
+    Notes:
+        - The LAI values are processed as float32, so the statistics are
+          float32 as well.
     """
-    Q1 = np.percentile(lai_data, 25)
-    Q2 = np.percentile(lai_data, 50)
-    Q3 = np.percentile(lai_data, 75)
+    # Keep the data in float32 (no copy if it is float32 already)
+    lai_data = np.asarray(lai_data, dtype=np.float32)
+
+    # Calculate the extrema and all quartiles in one call, so the data are
+    # partitioned once (the 0th and 100th percentiles are the exact minimum
+    # and maximum)
+    min_val, Q1, Q2, Q3, max_val = np.percentile(
+        lai_data, BOXPLOT_PERCENTILES, axis=axis
+    )
     IQR = Q3 - Q1
     lower_whisker = Q1 - 1.5 * IQR
     upper_whisker = Q3 + 1.5 * IQR
-    min_val = np.min(lai_data)
-    max_val = np.max(lai_data)
 
     return {
         "Min": min_val,
@@ -31,6 +55,193 @@ def calculate_boxplot_stats(lai_data: np.ndarray) -> dict:
     }
 
 
+def calculate_mean_and_boxplot_stats(
+    lai_data: np.ndarray,
+    axis: int | None = None,
+) -> dict:
+    """
+    Calculate the mean LAI value and boxplot statistics for the LAI values of
+    a single land use and elevation cluster.
+
+    Parameters:
+        lai_data (numpy.ndarray): Array containing the LAI values of the
+          cluster, e.g. a 1D array for a single LAI file or a 2D array of
+          shape (n_files, n_pixels) for several LAI files.
+        axis (int, optional): Axis along which the statistics are calculated.
+          Use `axis=1` to get the statistics of every LAI file of a 2D array
+          at once. Defaults to None (statistics of the whole array).
+
+    Returns:
+        dict: A dictionary containing the mean LAI value and boxplot
+          statistics.
+    """
+    mean_lai = np.mean(lai_data, axis=axis, dtype=np.float32)
+    boxplot_stats = calculate_boxplot_stats(lai_data, axis=axis)
+    return {"Mean_LAI": mean_lai, **boxplot_stats}
+
+
+def calculate_cluster_stats(
+    sorted_lai: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    max_workers: int | None = None,
+) -> dict:
+    """
+    Calculate the mean LAI value and boxplot statistics of all clusters for
+    several LAI files at once.
+
+    Parameters:
+        sorted_lai (numpy.ndarray): A (n_files, n_pixels) array with the LAI
+          values of every file, with the pixels ordered by cluster (see
+          `build_cluster_index`).
+        starts (numpy.ndarray): Start position of each cluster.
+        ends (numpy.ndarray): End position (exclusive) of each cluster.
+        max_workers (int, optional): Number of threads calculating the
+          quartiles of the clusters. Defaults to None, which means the number
+          of CPUs. With 1 the clusters are processed in the current thread.
+
+    Returns:
+        dict: A dictionary with the same keys as
+          `calculate_mean_and_boxplot_stats`, where every value is a float32
+          array of shape (n_files, n_clusters).
+
+    Notes:
+        - The clusters must be contiguous and non-empty, as returned by
+          `build_cluster_index`. The mean, minimum and maximum of all
+          clusters are then calculated by single `reduceat` passes over the
+          whole array; only the quartiles need one call per cluster.
+        - The mean is accumulated in float64 and returned as float32.
+        - The clusters are independent and numpy releases the GIL while it
+          partitions the data, so their quartiles are calculated in threads.
+    """
+    sorted_lai = np.asarray(sorted_lai, dtype=np.float32)
+    cluster_sizes = ends - starts
+
+    # Reduce all clusters at once
+    mean_lai = (
+        np.add.reduceat(sorted_lai, starts, axis=1, dtype=np.float64)
+        / cluster_sizes
+    ).astype(np.float32)
+    min_val = np.minimum.reduceat(sorted_lai, starts, axis=1)
+    max_val = np.maximum.reduceat(sorted_lai, starts, axis=1)
+
+    # Calculate the quartiles of each cluster
+    quartiles = np.empty(
+        (len(QUARTILE_PERCENTILES), sorted_lai.shape[0], len(starts)),
+        dtype=np.float32,
+    )
+
+    def calculate_quartiles(k: int) -> None:
+        quartiles[:, :, k] = np.percentile(
+            sorted_lai[:, starts[k]:ends[k]], QUARTILE_PERCENTILES, axis=1
+        )
+
+    # Calculate the clusters in threads if more than one worker is available
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(starts))
+
+    if max_workers <= 1:
+        for k in range(len(starts)):
+            calculate_quartiles(k)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so that errors in threads are raised
+            list(executor.map(calculate_quartiles, range(len(starts))))
+    Q1, Q2, Q3 = quartiles
+
+    IQR = Q3 - Q1
+
+    return {
+        "Mean_LAI": mean_lai,
+        "Min": min_val,
+        "Q1": Q1,
+        "Median": Q2,
+        "Q3": Q3,
+        "Max": max_val,
+        "Lower Whisker": Q1 - 1.5 * IQR,
+        "Upper Whisker": Q3 + 1.5 * IQR,
+    }
+
+
+def build_cluster_index(
+    landuse_data: np.ndarray,
+    elevation_data: np.ndarray,
+    landuse_classes: List[int] | None = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build an index that groups raster pixels by land use and elevation class.
+
+    The pixels are sorted once by a combined (land use, elevation class) key,
+    so that the LAI values of every cluster form a contiguous slice of the
+    reordered LAI raster. Since the land use and elevation rasters are the
+    same for all LAI files, the index only needs to be built once.
+
+    Parameters:
+        landuse_data (numpy.ndarray): Array containing land use
+          classifications.
+        elevation_data (numpy.ndarray): Array containing elevation classes
+          (positive bin indices) with the same shape as `landuse_data`.
+        landuse_classes (List[int], optional): Land use classes to include
+          in the index. Defaults to None, which means all classes except 0
+          will be included.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: A tuple containing:
+          - order: Flat pixel indices sorted by cluster.
+          - cluster_landuse: Land use class of each cluster.
+          - cluster_elevation: Elevation class of each cluster.
+          - starts: Start position of each cluster in `order`.
+          - ends: End position (exclusive) of each cluster in `order`.
+
+    Notes:
+        - Clusters are ordered by land use class and then by elevation class.
+        - Pixels with a NaN land use class are not assigned to any cluster.
+        - The LAI values of cluster `k` are obtained with
+          `lai_data.ravel()[order][starts[k]:ends[k]]`.
+    """
+    # Encode land use classes as consecutive integer codes
+    landuse_values, landuse_codes = np.unique(
+        landuse_data.ravel(), return_inverse=True
+    )
+    elevation_flat = elevation_data.ravel().astype(np.int64)
+
+    # Select the land use classes that should be included
+    if landuse_classes is None:
+        is_selected_class = landuse_values != 0
+    else:
+        is_selected_class = np.isin(landuse_values, landuse_classes)
+    is_selected_class &= ~np.isnan(landuse_values)
+
+    # Combine land use and elevation into a single integer key
+    n_elevation_keys = int(elevation_flat.max()) + 1
+    if is_selected_class.all():
+        # Every pixel belongs to a selected class, so the per-pixel class
+        # test and the gathers of the selected pixels can be skipped
+        pixels = None
+        combined_key = landuse_codes.astype(np.int64) * n_elevation_keys
+        combined_key += elevation_flat
+    else:
+        # Keep only the pixels that belong to one of the selected classes
+        pixels = np.flatnonzero(is_selected_class[landuse_codes])
+        combined_key = (
+            landuse_codes[pixels].astype(np.int64) * n_elevation_keys
+        )
+        combined_key += elevation_flat[pixels]
+
+    # Sort the pixels by the combined key and find the cluster boundaries
+    sort_order = np.argsort(combined_key, kind="stable")
+    order = sort_order if pixels is None else pixels[sort_order]
+    sorted_key = combined_key[sort_order]
+    unique_keys, starts = np.unique(sorted_key, return_index=True)
+    ends = np.append(starts[1:], sorted_key.size)[:starts.size]
+
+    cluster_landuse = landuse_values[unique_keys // n_elevation_keys]
+    cluster_elevation = unique_keys % n_elevation_keys
+
+    return order, cluster_landuse, cluster_elevation, starts, ends
+
+
 def calculate_mean_and_boxplot_lai(
     lai_data: np.ndarray,
     landuse_data: np.ndarray,
@@ -55,7 +266,4 @@ def calculate_mean_and_boxplot_lai(
     """
     mask = (landuse_data == landuse_class) & (elevation_data == elev_class)
     if np.any(mask):
-        filtered_lai_data = lai_data[mask]
-        mean_lai = np.mean(filtered_lai_data)
-        boxplot_stats = calculate_boxplot_stats(filtered_lai_data)
-        return {"Mean_LAI": mean_lai, **boxplot_stats}
+        return calculate_mean_and_boxplot_stats(lai_data[mask])
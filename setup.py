@@ -1,30 +1,47 @@
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 
+def read_long_description() -> str:
+    """
+    Read the README next to this file (relative to the file, not to the
+    current directory), or return an empty string if it is missing.
+    """
+    try:
+        return (Path(__file__).parent / 'README.md').read_text(
+            encoding='utf-8'
+        )
+    except FileNotFoundError:
+        return ''
+
+
 setup(
     name='lai_data_processing',
     version='0.1.0',
-    packeges=find_packages(),
+    packages=find_packages(),
+    python_requires='>=3.10',
     install_requires=[
         'numpy==2.0.1',
         'pandas==2.2.2',
         'rasterio==1.3.10',
         'matplotlib==3.9.1',
     ],
-    entry_point={
-        'console_scriots':[
+    entry_points={
+        'console_scripts':[
             # TODO: Add console scripts
         ],
     },
     author='Ivan Shkvyr',
     author_email='shkvyr.i@czechglobe.cz',
     description=(
-                 'This module processes Leaf Area Index (LAI) data and '
-                 'calculates basic statistical indicators of the LAI index '
-                 'based on land use and elevation. The processed data is then '
-                 'saved in a CSV file and visualized in the form of graphs.'
-                 ),
-    long_description=open('README.md').read(),
+        'This module processes Leaf Area Index (LAI) data and '
+        'calculates basic statistical indicators of the LAI index '
+        'based on land use and elevation. The processed data is then '
+        'saved in a CSV file and visualized in the form of graphs.'
+    ),
+    long_description=read_long_description(),
     long_description_content_type='text/markdown',
     url='https://github.com/IvanShkvyr/lai_data_processing_project',
-)
\ No newline at end of file
+)
+